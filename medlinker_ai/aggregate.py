@@ -1,7 +1,9 @@
 """Regional aggregation and medical desert detection."""
 
 from typing import Dict, List, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
 from medlinker_ai.models import FacilityAnalysisOutput, RegionSummary
 from medlinker_ai.config import (
@@ -9,7 +11,8 @@ from medlinker_ai.config import (
     CRITICAL_EQUIPMENT,
     CRITICAL_STAFFING,
     DESERT_SCORE_WEIGHTS,
-    MAX_DESERT_SCORE
+    MAX_DESERT_SCORE,
+    PARALLEL_AGGREGATION_MIN_REGIONS
 )
 from medlinker_ai.normalize import normalize_and_map
 from medlinker_ai.utils import generate_trace_id
@@ -30,56 +33,77 @@ def group_by_region(
     grouped = defaultdict(list)
     
     for output in facility_outputs:
-        # Use region and country fields from the output
-        country = output.country if hasattr(output, 'country') else "UNKNOWN"
-        region = output.region if hasattr(output, 'region') else "UNKNOWN"
-        
-        grouped[(country, region)].append(output)
+        # country/region always exist on the model (with defaults when unknown)
+        grouped[(output.country, output.region)].append(output)
     
     return grouped
 
 
-def compute_coverage(
+def compute_coverage_and_missing(
     facilities: List[FacilityAnalysisOutput]
-) -> Dict[str, Dict[str, int]]:
-    """Compute coverage counts for services, equipment, and staffing.
+) -> Tuple[Dict[str, Dict[str, int]], List[str], Dict[str, int]]:
+    """Compute coverage counts and missing critical capabilities in one pass.
     
     Args:
         facilities: List of facility outputs for a region
         
     Returns:
-        Dictionary with coverage counts by category
+        Tuple of (coverage counts by category, missing critical capability names,
+        missing counts keyed by DESERT_SCORE_WEIGHTS category)
     """
-    coverage = {
-        "services": defaultdict(int),
-        "equipment": defaultdict(int),
-        "staffing": defaultdict(int)
-    }
+    services = defaultdict(int)
+    equipment = defaultdict(int)
+    staffing = defaultdict(int)
     
     for facility in facilities:
         caps = facility.extracted_capabilities
         
         # Count services
         for service in caps.services:
-            normalized = normalize_and_map(service)
-            coverage["services"][normalized] += 1
+            services[normalize_and_map(service)] += 1
         
         # Count equipment
         for equip in caps.equipment:
-            normalized = normalize_and_map(equip)
-            coverage["equipment"][normalized] += 1
+            equipment[normalize_and_map(equip)] += 1
         
         # Count staffing
         for staff in caps.staffing:
-            normalized = normalize_and_map(staff)
-            coverage["staffing"][normalized] += 1
-    
-    # Convert defaultdicts to regular dicts
-    return {
-        "services": dict(coverage["services"]),
-        "equipment": dict(coverage["equipment"]),
-        "staffing": dict(coverage["staffing"])
+            staffing[normalize_and_map(staff)] += 1
+    
+    # Counts are only ever incremented, so presence means coverage > 0
+    missing_services = [f"service:{s}" for s in CRITICAL_SERVICES if s not in services]
+    missing_equipment = [f"equipment:{e}" for e in CRITICAL_EQUIPMENT if e not in equipment]
+    missing_staffing = [f"staffing:{s}" for s in CRITICAL_STAFFING if s not in staffing]
+    
+    missing = missing_services + missing_equipment + missing_staffing
+    missing_counts = {
+        "service": len(missing_services),
+        "equipment": len(missing_equipment),
+        "staffing": len(missing_staffing)
+    }
+    
+    coverage = {
+        "services": dict(services),
+        "equipment": dict(equipment),
+        "staffing": dict(staffing)
     }
+    
+    return coverage, missing, missing_counts
+
+
+def compute_coverage(
+    facilities: List[FacilityAnalysisOutput]
+) -> Dict[str, Dict[str, int]]:
+    """Compute coverage counts for services, equipment, and staffing.
+    
+    Args:
+        facilities: List of facility outputs for a region
+        
+    Returns:
+        Dictionary with coverage counts by category
+    """
+    coverage, _, _ = compute_coverage_and_missing(facilities)
+    return coverage
 
 
 def compute_missing_critical(
@@ -93,24 +117,15 @@ def compute_missing_critical(
     Returns:
         List of missing critical capability names
     """
-    missing = []
-    
-    # Check critical services
-    for service in CRITICAL_SERVICES:
-        if coverage["services"].get(service, 0) == 0:
-            missing.append(f"service:{service}")
+    services = coverage["services"]
+    equipment = coverage["equipment"]
+    staffing = coverage["staffing"]
     
-    # Check critical equipment
-    for equip in CRITICAL_EQUIPMENT:
-        if coverage["equipment"].get(equip, 0) == 0:
-            missing.append(f"equipment:{equip}")
-    
-    # Check critical staffing
-    for staff in CRITICAL_STAFFING:
-        if coverage["staffing"].get(staff, 0) == 0:
-            missing.append(f"staffing:{staff}")
-    
-    return missing
+    return (
+        [f"service:{s}" for s in CRITICAL_SERVICES if not services.get(s, 0)] +
+        [f"equipment:{e}" for e in CRITICAL_EQUIPMENT if not equipment.get(e, 0)] +
+        [f"staffing:{s}" for s in CRITICAL_STAFFING if not staffing.get(s, 0)]
+    )
 
 
 def compute_desert_score(missing_critical: List[str]) -> int:
@@ -122,20 +137,30 @@ def compute_desert_score(missing_critical: List[str]) -> int:
     Returns:
         Desert score (0-100)
     """
-    score = 0
+    # Count missing by category in a single pass
+    missing_counts = Counter(m.split(":", 1)[0] for m in missing_critical)
     
-    # Count missing by category
-    missing_services = sum(1 for m in missing_critical if m.startswith("service:"))
-    missing_equipment = sum(1 for m in missing_critical if m.startswith("equipment:"))
-    missing_staffing = sum(1 for m in missing_critical if m.startswith("staffing:"))
+    return compute_desert_score_from_counts(missing_counts)
+
+
+def compute_desert_score_from_counts(missing_counts: Dict[str, int]) -> int:
+    """Compute medical desert score from per-category missing counts.
     
-    # Add points for each missing item
-    score += missing_services * DESERT_SCORE_WEIGHTS["service"]
-    score += missing_equipment * DESERT_SCORE_WEIGHTS["equipment"]
-    score += missing_staffing * DESERT_SCORE_WEIGHTS["staffing"]
+    Args:
+        missing_counts: Number of missing critical items keyed by
+            DESERT_SCORE_WEIGHTS category ("service", "equipment", "staffing")
+        
+    Returns:
+        Desert score (0-100)
+    """
+    # Add points for each missing item, stopping once the cap is reached
+    score = 0
+    for category, weight in DESERT_SCORE_WEIGHTS.items():
+        score += missing_counts.get(category, 0) * weight
+        if score >= MAX_DESERT_SCORE:
+            return MAX_DESERT_SCORE
     
-    # Cap at maximum
-    return min(score, MAX_DESERT_SCORE)
+    return score
 
 
 def get_supporting_facilities(
@@ -151,15 +176,20 @@ def get_supporting_facilities(
     Returns:
         List of facility IDs (prioritize VERIFIED facilities)
     """
-    # Prioritize VERIFIED facilities
-    verified = [f for f in facilities if f.status == "VERIFIED"]
-    
-    if len(verified) >= max_count:
-        return [f.facility_id for f in verified[:max_count]]
+    # Prioritize VERIFIED facilities, stopping once max_count are found
+    supporting = list(islice(
+        (f.facility_id for f in facilities if f.status == "VERIFIED"),
+        max_count
+    ))
     
     # Add other facilities if needed
-    all_facilities = verified + [f for f in facilities if f.status != "VERIFIED"]
-    return [f.facility_id for f in all_facilities[:max_count]]
+    if len(supporting) < max_count:
+        supporting.extend(islice(
+            (f.facility_id for f in facilities if f.status != "VERIFIED"),
+            max_count - len(supporting)
+        ))
+    
+    return supporting
 
 
 def compute_region_summary(
@@ -180,18 +210,13 @@ def compute_region_summary(
         RegionSummary with aggregated data
     """
     # Count statuses
-    status_counts = defaultdict(int)
-    for facility in facilities:
-        status_counts[facility.status] += 1
+    status_counts = Counter(facility.status for facility in facilities)
     
-    # Compute coverage
-    coverage = compute_coverage(facilities)
-    
-    # Identify missing critical capabilities
-    missing_critical = compute_missing_critical(coverage)
+    # Compute coverage and identify missing critical capabilities
+    coverage, missing_critical, missing_counts = compute_coverage_and_missing(facilities)
     
     # Compute desert score
-    desert_score = compute_desert_score(missing_critical)
+    desert_score = compute_desert_score_from_counts(missing_counts)
     
     # Get supporting facilities
     supporting_facility_ids = get_supporting_facilities(facilities)
@@ -199,24 +224,7 @@ def compute_region_summary(
     # Generate trace ID
     trace_id = generate_trace_id()
     
-    # Log aggregation span if parent trace provided
-    if parent_trace_id:
-        log_span(
-            trace_id=parent_trace_id,
-            step_name="aggregate",
-            inputs_summary={
-                "country": country,
-                "region": region,
-                "facilities_count": len(facilities)
-            },
-            outputs_summary={
-                "desert_score": desert_score,
-                "missing_critical_count": len(missing_critical)
-            },
-            evidence_refs=len(facilities)
-        )
-    
-    return RegionSummary(
+    summary = RegionSummary(
         country=country,
         region=region,
         total_facilities=len(facilities),
@@ -228,6 +236,43 @@ def compute_region_summary(
         supporting_facility_ids=supporting_facility_ids,
         trace_id=trace_id
     )
+    
+    # Log aggregation span if parent trace provided
+    if parent_trace_id:
+        _log_aggregate_span(parent_trace_id, summary)
+    
+    return summary
+
+
+def _log_aggregate_span(parent_trace_id: str, summary: RegionSummary) -> None:
+    """Log the aggregation span for a computed region summary.
+    
+    Args:
+        parent_trace_id: Parent trace ID to log under
+        summary: Computed region summary
+    """
+    log_span(
+        trace_id=parent_trace_id,
+        step_name="aggregate",
+        inputs_summary={
+            "country": summary.country,
+            "region": summary.region,
+            "facilities_count": summary.total_facilities
+        },
+        outputs_summary={
+            "desert_score": summary.desert_score,
+            "missing_critical_count": len(summary.missing_critical)
+        },
+        evidence_refs=summary.total_facilities
+    )
+
+
+def _compute_region_summary_task(
+    item: Tuple[Tuple[str, str], List[FacilityAnalysisOutput]]
+) -> RegionSummary:
+    """Compute a region summary in a worker process (no trace logging)."""
+    (country, region), facilities = item
+    return compute_region_summary(country, region, facilities)
 
 
 def aggregate_regions(
@@ -246,11 +291,24 @@ def aggregate_regions(
     # Group by region
     grouped = group_by_region(facility_outputs)
     
-    # Compute summary for each region
-    summaries = []
-    for (country, region), facilities in grouped.items():
-        summary = compute_region_summary(country, region, facilities, parent_trace_id)
-        summaries.append(summary)
+    # Compute summary for each region. Regions are independent, so large
+    # inputs are spread across worker processes; small ones stay in-process
+    # where pool startup would dominate.
+    if len(grouped) >= PARALLEL_AGGREGATION_MIN_REGIONS:
+        with ProcessPoolExecutor() as executor:
+            summaries = list(executor.map(
+                _compute_region_summary_task, grouped.items(), chunksize=8
+            ))
+        
+        # Workers cannot write to this process's trace store, so log here
+        if parent_trace_id:
+            for summary in summaries:
+                _log_aggregate_span(parent_trace_id, summary)
+    else:
+        summaries = []
+        for (country, region), facilities in grouped.items():
+            summary = compute_region_summary(country, region, facilities, parent_trace_id)
+            summaries.append(summary)
     
     # Sort by desert score (descending) for easy identification of problem areas
     summaries.sort(key=lambda s: s.desert_score, reverse=True)
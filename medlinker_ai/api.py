@@ -1,23 +1,49 @@
 """FastAPI backend for MedLinker AI."""
 
-import json
+import gzip
 import logging
+import os
+import re
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import unquote
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
+from medlinker_ai.constants import STATUS_VERIFIED, STATUS_INCOMPLETE, STATUS_SUSPICIOUS
 from medlinker_ai.models import (
+    FacilityDocInput,
     FacilityAnalysisOutput,
     RegionSummary,
     Citation,
+    construct_facility_output,
+    construct_region_summary,
 )
-from medlinker_ai.qa import answer_planner_question
+from medlinker_ai.qa import answer_planner_question, build_search_texts
 from medlinker_ai.trace import get_trace, TraceRun
+from medlinker_ai.utils import open_data_file, resolve_data_file
+
+# Optional features, imported once at startup. Whether they are enabled is
+# driven by environment variables and still checked on each request.
+try:
+    from medlinker_ai.rag import is_rag_available
+    RAG_MODULE_AVAILABLE = True
+except ImportError:
+    RAG_MODULE_AVAILABLE = False
+
+try:
+    from medlinker_ai.orchestrator import run_ask_flow, is_orchestrator_enabled
+    ORCHESTRATOR_MODULE_AVAILABLE = True
+except ImportError:
+    ORCHESTRATOR_MODULE_AVAILABLE = False
 
 
 # Load environment variables from .env file
@@ -28,6 +54,32 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _resolve_log_level() -> str:
+    """Read MEDLINKER_LOG_LEVEL, falling back to INFO for unknown names.
+    
+    e.g. MEDLINKER_LOG_LEVEL=WARNING silences per-request INFO logs in production.
+    """
+    level = os.environ.get("MEDLINKER_LOG_LEVEL", "INFO").strip().upper()
+    if level not in logging.getLevelNamesMapping():
+        logger.warning("Invalid MEDLINKER_LOG_LEVEL %r, using INFO", level)
+        return "INFO"
+    return level
+
+
+logger.setLevel(_resolve_log_level())
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson.
+    
+    Used for endpoints that return plain dicts. Endpoints with a response_model
+    are already serialized to JSON bytes by Pydantic and keep the default class.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="MedLinker AI",
@@ -45,6 +97,37 @@ app.add_middleware(
 )
 
 
+
+class _SelectiveGZipMiddleware:
+    """GZipMiddleware that leaves pre-compressed routes untouched.
+    
+    Only recent Starlette versions skip responses that already carry a
+    Content-Encoding header, so routes serving their own gzip bodies bypass
+    the middleware entirely instead of relying on that.
+    """
+    
+    def __init__(self, app: Any, skip_paths: Tuple[str, ...], **gzip_options: Any):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, **gzip_options)
+        self.skip_paths = frozenset(skip_paths)
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "http" and scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip_app(scope, receive, send)
+
+
+# Compress larger responses for clients that accept gzip. /facilities and
+# /regions serve pre-compressed bodies (see _cached_json_response).
+app.add_middleware(
+    _SelectiveGZipMiddleware,
+    skip_paths=("/facilities", "/regions"),
+    minimum_size=1024,
+    compresslevel=5
+)
+
+
 # Request/Response models
 class AskRequest(BaseModel):
     """Request model for Q&A endpoint."""
@@ -62,7 +145,221 @@ class AskResponse(BaseModel):
     trace_id: str
 
 
+# Trace IDs are UUID4 strings (see utils.generate_trace_id)
+_TRACE_ID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
+
+# Parsed data files keyed by resolved path -> ((mtime_ns, size), parsed data).
+# The files only change when the CLI pipeline re-runs, so requests reuse the
+# parsed lists until the file on disk changes.
+_data_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_data_cache_lock = threading.Lock()
+
+# JSON-encoded response bodies keyed by name -> (source list, (json, gzip)).
+# Holding the source list lets a lookup check identity against the current
+# cached data, so bodies are re-encoded only after the data is reloaded.
+_encoded_cache: Dict[str, Tuple[List[Any], Tuple[bytes, bytes]]] = {}
+
+# Keyword-retrieval texts for /ask, built once per loaded (facilities, regions)
+# pair and checked by identity like _encoded_cache. The loaded lists are never
+# mutated, and only the current pair is held.
+_search_texts_cache: Optional[Tuple[List[Any], List[Any], Tuple[List[str], List[str]]]] = None
+
+_facility_adapter = TypeAdapter(FacilityAnalysisOutput)
+_facility_list_adapter = TypeAdapter(List[FacilityAnalysisOutput])
+_region_list_adapter = TypeAdapter(List[RegionSummary])
+
+
 # Helper functions
+def _load_cached(path: Path, parse: Callable[[Path], Any]) -> Any:
+    """Return parsed file contents, re-parsing only when the file changes.
+    
+    Args:
+        path: File to load
+        parse: Function that parses the file into its in-memory form
+        
+    Returns:
+        Parsed file contents
+    """
+    stat = path.stat()
+    key = str(path.resolve())
+    version = (stat.st_mtime_ns, stat.st_size)
+    
+    with _data_cache_lock:
+        cached = _data_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    data = parse(path)
+    
+    with _data_cache_lock:
+        _data_cache[key] = (version, data)
+    
+    return data
+
+
+def _encode_cached(
+    name: str,
+    data: List[Any],
+    adapter: TypeAdapter
+) -> Tuple[bytes, bytes]:
+    """Return data encoded as JSON, re-encoding only when data is a new list.
+    
+    Args:
+        name: Cache slot name
+        data: Cached list returned by a loader
+        adapter: TypeAdapter used to serialize the list
+        
+    Returns:
+        Tuple of (JSON bytes, gzip-compressed JSON bytes) for the list
+    """
+    with _data_cache_lock:
+        cached = _encoded_cache.get(name)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    
+    body = adapter.dump_json(data)
+    bodies = (body, gzip.compress(body, compresslevel=9, mtime=0))
+    
+    with _data_cache_lock:
+        _encoded_cache[name] = (data, bodies)
+    
+    return bodies
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows a gzip-encoded response.
+    
+    Honors q-values, so "gzip;q=0" is a refusal. A "*" entry covers gzip
+    unless gzip is listed explicitly.
+    
+    Args:
+        accept_encoding: Raw Accept-Encoding header value
+        
+    Returns:
+        True if gzip has a non-zero quality
+    """
+    qualities = {}
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def _cached_json_response(
+    request: Request,
+    name: str,
+    data: List[Any],
+    adapter: TypeAdapter
+) -> Response:
+    """Build a JSON response for a cached list, pre-compressed when accepted.
+    
+    Args:
+        request: Incoming request (checked for Accept-Encoding: gzip)
+        name: Cache slot name
+        data: Cached list returned by a loader
+        adapter: TypeAdapter used to serialize the list
+        
+    Returns:
+        Response carrying the encoded list
+    """
+    body, gzip_body = _encode_cached(name, data, adapter)
+    headers = {"Vary": "Accept-Encoding"}
+    
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=gzip_body, media_type="application/json", headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def clear_data_cache() -> None:
+    """Drop all cached facility and region data."""
+    with _data_cache_lock:
+        _data_cache.clear()
+        _encoded_cache.clear()
+    
+    global _search_texts_cache
+    _search_texts_cache = None
+
+
+def _cached_search_texts(
+    facilities: List[FacilityAnalysisOutput],
+    regions: List[RegionSummary]
+) -> Tuple[List[str], List[str]]:
+    """Return retrieval texts for the loaded data, rebuilding after a reload.
+    
+    Args:
+        facilities: Cached facility list returned by load_facilities
+        regions: Cached region list returned by load_regions
+        
+    Returns:
+        Tuple of (facility texts, region texts) from qa.build_search_texts
+    """
+    global _search_texts_cache
+    
+    cached = _search_texts_cache
+    if cached is not None and cached[0] is facilities and cached[1] is regions:
+        return cached[2]
+    
+    texts = build_search_texts(facilities, regions)
+    _search_texts_cache = (facilities, regions, texts)
+    return texts
+
+
+def _validate_disk_data() -> bool:
+    """Whether data files should be fully validated on load (debugging aid)."""
+    return os.environ.get("MEDLINKER_VALIDATE_DISK", "0") == "1"
+
+
+def _construct_facility_line(line: bytes) -> FacilityAnalysisOutput:
+    """Build a facility output from one trusted JSONL line without validation."""
+    return construct_facility_output(orjson.loads(line))
+
+
+def _parse_facilities_file(path: Path) -> List[FacilityAnalysisOutput]:
+    """Parse a facilities JSONL file (optionally .gz/.zst) written by the CLI pipeline.
+    
+    The pipeline validated every record before writing it, so rows are
+    constructed without re-validation unless MEDLINKER_VALIDATE_DISK=1.
+    """
+    rehydrate = (
+        _facility_adapter.validate_json if _validate_disk_data()
+        else _construct_facility_line
+    )
+    facilities = []
+    with open_data_file(path) as f:
+        for line in f:
+            if line.strip():
+                facilities.append(rehydrate(line))
+    return facilities
+
+
+def _parse_regions_file(path: Path) -> List[RegionSummary]:
+    """Parse a regions JSON file written by the CLI pipeline."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    if _validate_disk_data():
+        return _region_list_adapter.validate_json(data)
+    return [construct_region_summary(r) for r in orjson.loads(data)]
+
+
 def load_facilities() -> List[FacilityAnalysisOutput]:
     """Load facility outputs from file.
     
@@ -72,21 +369,16 @@ def load_facilities() -> List[FacilityAnalysisOutput]:
     Raises:
         HTTPException: If file not found or invalid
     """
-    facilities_file = Path("./outputs/facilities.jsonl")
+    facilities_file = resolve_data_file("./outputs/facilities.jsonl")
     
-    if not facilities_file.exists():
+    if facilities_file is None:
         raise HTTPException(
             status_code=404,
             detail="Facilities data not found. Run 'python -m medlinker_ai.cli run_dataset' first."
         )
     
-    facilities = []
     try:
-        with open(facilities_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    facilities.append(FacilityAnalysisOutput(**data))
+        facilities = _load_cached(facilities_file, _parse_facilities_file)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -114,9 +406,7 @@ def load_regions() -> List[RegionSummary]:
         )
     
     try:
-        with open(regions_file, 'r') as f:
-            regions_data = json.load(f)
-            regions = [RegionSummary(**r) for r in regions_data]
+        regions = _load_cached(regions_file, _parse_regions_file)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -127,8 +417,15 @@ def load_regions() -> List[RegionSummary]:
 
 
 # API Endpoints
+#
+# Data endpoints are plain `def` on purpose: FastAPI runs them in its
+# threadpool, so cache-miss file reads/parsing and response_model validation
+# of large lists happen off the event loop. An `async def` version would run
+# that validation on the loop itself, and async file reads would not help
+# since parsing dominates. Endpoints that only return a constant dict are
+# `async def` to skip the threadpool hop.
 @app.get("/")
-def root():
+async def root():
     """Root endpoint with API information."""
     return {
         "name": "MedLinker AI",
@@ -144,7 +441,7 @@ def root():
 
 
 @app.get("/facilities", response_model=List[FacilityAnalysisOutput])
-def get_facilities():
+def get_facilities(request: Request):
     """Get all facility analysis outputs.
     
     Returns all processed healthcare facilities with extracted capabilities,
@@ -154,11 +451,16 @@ def get_facilities():
         List of facility analysis outputs with extracted capabilities,
         verification status, and citations.
     """
-    return load_facilities()
+    # Loaded data is immutable, so the encoded (and gzipped) body is reused
+    # until the file changes. Returning a Response skips FastAPI's
+    # per-request serialization; response_model still documents the schema.
+    return _cached_json_response(
+        request, "facilities", load_facilities(), _facility_list_adapter
+    )
 
 
 @app.get("/regions", response_model=List[RegionSummary])
-def get_regions():
+def get_regions(request: Request):
     """Get all regional summaries with medical desert scores.
     
     Returns regional aggregations showing healthcare coverage, missing
@@ -168,7 +470,7 @@ def get_regions():
         List of regional summaries with desert scores, missing capabilities,
         and coverage statistics.
     """
-    return load_regions()
+    return _cached_json_response(request, "regions", load_regions(), _region_list_adapter)
 
 
 @app.post("/ask", response_model=AskResponse)
@@ -195,48 +497,41 @@ def ask_question(request: AskRequest):
             detail="Question must be a non-empty string."
         )
     
-    logger.info(f"[/ask] Question received: {request.question[:100]}")
+    logger.info("[/ask] Question received: %.100s", request.question)
     
-    # Load data
-    try:
-        facilities = load_facilities()
-        regions = load_regions()
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"[/ask] Error loading data: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error loading data: {str(e)}"
-        )
+    # Load data (served from the in-process cache unless the files changed).
+    # answer_planner_question makes several passes over both lists, so they
+    # stay materialized rather than streamed. Both loaders already map every
+    # failure to an HTTPException.
+    facilities = load_facilities()
+    regions = load_regions()
+    search_texts = _cached_search_texts(facilities, regions)
     
     # Check for RAG
-    rag_enabled = False
-    try:
-        from medlinker_ai.rag import is_rag_available
-        rag_enabled = is_rag_available()
-        if rag_enabled:
-            logger.info("[/ask] RAG retrieval: ENABLED")
-        else:
-            logger.info("[/ask] RAG retrieval: DISABLED")
-    except ImportError:
+    if not RAG_MODULE_AVAILABLE:
         logger.info("[/ask] RAG retrieval: NOT INSTALLED (using keyword matching)")
-    except Exception as e:
-        logger.warning(f"[/ask] RAG check failed: {str(e)}, falling back to keyword matching")
+    else:
+        try:
+            if is_rag_available():
+                logger.info("[/ask] RAG retrieval: ENABLED")
+            else:
+                logger.info("[/ask] RAG retrieval: DISABLED")
+        except Exception as e:
+            logger.warning("[/ask] RAG check failed: %s, falling back to keyword matching", e)
     
     # Check for orchestrator
     orchestrator_enabled = False
-    try:
-        from medlinker_ai.orchestrator import run_ask_flow, is_orchestrator_enabled
-        orchestrator_enabled = is_orchestrator_enabled()
-        if orchestrator_enabled:
-            logger.info("[/ask] LangGraph orchestration: ENABLED")
-        else:
-            logger.info("[/ask] LangGraph orchestration: DISABLED")
-    except ImportError:
+    if not ORCHESTRATOR_MODULE_AVAILABLE:
         logger.info("[/ask] LangGraph orchestration: NOT INSTALLED (using direct calls)")
-    except Exception as e:
-        logger.warning(f"[/ask] Orchestrator check failed: {str(e)}, falling back to direct calls")
+    else:
+        try:
+            orchestrator_enabled = is_orchestrator_enabled()
+            if orchestrator_enabled:
+                logger.info("[/ask] LangGraph orchestration: ENABLED")
+            else:
+                logger.info("[/ask] LangGraph orchestration: DISABLED")
+        except Exception as e:
+            logger.warning("[/ask] Orchestrator check failed: %s, using direct calls", e)
     
     # Answer question
     try:
@@ -244,16 +539,18 @@ def ask_question(request: AskRequest):
             result = run_ask_flow(
                 request.question,
                 facilities,
-                regions
+                regions,
+                search_texts=search_texts
             )
         else:
             result = answer_planner_question(
                 request.question,
                 facilities,
-                regions
+                regions,
+                search_texts=search_texts
             )
     except Exception as e:
-        logger.error(f"[/ask] Error answering question: {str(e)}")
+        logger.error("[/ask] Error answering question: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error answering question: {str(e)}"
@@ -261,13 +558,13 @@ def ask_question(request: AskRequest):
     
     # Ensure result has required fields
     if not result or "answer" not in result or "citations" not in result or "trace_id" not in result:
-        logger.error(f"[/ask] Invalid result format: {result}")
+        logger.error("[/ask] Invalid result format: %s", result)
         raise HTTPException(
             status_code=500,
             detail="Internal error: Invalid response format"
         )
     
-    logger.info(f"[/ask] Answer generated with trace_id: {result['trace_id']}")
+    logger.info("[/ask] Answer generated with trace_id: %s", result["trace_id"])
     
     return AskResponse(
         answer=result["answer"],
@@ -298,12 +595,13 @@ def get_trace_by_id(trace_id: str):
     trace_id = trace_id.strip('"').strip("'")
     trace_id = unquote(trace_id)
     
-    logger.info(f"[/trace] Looking up trace_id: {trace_id}")
+    logger.info("[/trace] Looking up trace_id: %s", trace_id)
     
-    trace = get_trace(trace_id)
+    # Malformed IDs cannot match a trace, so skip the trace store scan
+    trace = get_trace(trace_id) if _TRACE_ID_RE.fullmatch(trace_id) else None
     
     if not trace:
-        logger.warning(f"[/trace] Trace not found: {trace_id}")
+        logger.warning("[/trace] Trace not found: %s", trace_id)
         raise HTTPException(
             status_code=404,
             detail="Trace not found. Make sure you copied the trace_id exactly (without quotes)."
@@ -313,7 +611,7 @@ def get_trace_by_id(trace_id: str):
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint.
     
     Returns:
@@ -322,8 +620,32 @@ def health_check():
     return {"status": "healthy"}
 
 
-@app.post("/demo/process_facility")
-def demo_process_facility(facility_input: dict):
+@app.post("/admin/invalidate")
+def invalidate_data_cache():
+    """Drop cached facility and region data (development aid).
+    
+    Cached data is already reloaded whenever the files on disk change; this
+    forces a reload on the next request regardless.
+    
+    Returns:
+        Invalidation status
+    """
+    clear_data_cache()
+    logger.info("[/admin/invalidate] Data cache cleared")
+    return {"status": "invalidated"}
+
+
+@app.post(
+    "/demo/process_facility",
+    response_class=OrjsonResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": FacilityDocInput.model_json_schema()}}
+        }
+    }
+)
+async def demo_process_facility(request: Request):
     """Demo endpoint: Process a single facility end-to-end with unified tracing.
     
     This endpoint demonstrates the complete pipeline with step-level tracing:
@@ -332,28 +654,42 @@ def demo_process_facility(facility_input: dict):
     3. Aggregate region (aggregate span)
     4. Answer question (answer span)
     
+    The body is parsed and validated as FacilityDocInput in a single
+    pydantic-core pass; the blocking pipeline then runs in the threadpool.
+    
     Args:
-        facility_input: FacilityDocInput as dict
+        request: Request whose JSON body is a FacilityDocInput
         
     Returns:
         Complete analysis with unified trace_id showing all steps
     """
-    from medlinker_ai.models import FacilityDocInput
-    from medlinker_ai.extract import extract_capabilities
-    from medlinker_ai.verify import check_incomplete_rules, check_suspicious_rules, calculate_confidence
-    from medlinker_ai.aggregate import compute_region_summary
-    from medlinker_ai.utils import generate_trace_id
-    from medlinker_ai.trace import start_trace, log_span, end_trace
-    
     try:
         # Parse input
-        doc = FacilityDocInput(**facility_input)
-    except Exception as e:
+        doc = FacilityDocInput.model_validate_json(await request.body())
+    except ValidationError as e:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid facility input: {str(e)}"
         )
     
+    return await run_in_threadpool(_process_facility_pipeline, doc)
+
+
+def _process_facility_pipeline(doc: FacilityDocInput) -> OrjsonResponse:
+    """Run the traced demo pipeline for one validated facility document.
+    
+    Args:
+        doc: Validated facility input
+        
+    Returns:
+        Response with the analysis, region summary, sample Q&A and trace_id
+    """
+    from medlinker_ai.extract import extract_capabilities
+    from medlinker_ai.verify import check_incomplete_rules, check_suspicious_rules, calculate_confidence
+    from medlinker_ai.aggregate import compute_region_summary
+    from medlinker_ai.utils import generate_trace_id
+    from medlinker_ai.trace import start_trace, log_span, end_trace
+    
     # Start unified trace
     trace_id = generate_trace_id()
     start_trace(trace_id)
@@ -373,13 +709,13 @@ def demo_process_facility(facility_input: dict):
         
         # Determine status
         if len(suspicious_reasons) > 0:
-            status = "SUSPICIOUS"
+            status = STATUS_SUSPICIOUS
             reasons = suspicious_reasons + incomplete_reasons
         elif len(incomplete_reasons) > 0:
-            status = "INCOMPLETE"
+            status = STATUS_INCOMPLETE
             reasons = incomplete_reasons
         else:
-            status = "VERIFIED"
+            status = STATUS_VERIFIED
             reasons = []
         
         # Merge all citations
@@ -404,7 +740,6 @@ def demo_process_facility(facility_input: dict):
         )
         
         # Create facility output
-        from medlinker_ai.models import FacilityAnalysisOutput
         facility_output = FacilityAnalysisOutput(
             facility_id=doc.facility_id,
             extracted_capabilities=capabilities,
@@ -426,9 +761,9 @@ def demo_process_facility(facility_input: dict):
         # Step 4: Generate sample answer
         sample_question = f"What is the status of {doc.facility_name}?"
         sample_answer = f"Facility {doc.facility_name} in {doc.region}, {doc.country} has status: {status}. "
-        if status == "VERIFIED":
+        if status == STATUS_VERIFIED:
             sample_answer += "All capabilities are verified and consistent."
-        elif status == "INCOMPLETE":
+        elif status == STATUS_INCOMPLETE:
             sample_answer += f"Missing information: {', '.join(reasons[:2])}."
         else:
             sample_answer += f"Inconsistencies detected: {', '.join(reasons[:2])}."
@@ -451,7 +786,9 @@ def demo_process_facility(facility_input: dict):
         # End trace
         end_trace(trace_id)
         
-        return {
+        # Returning the response directly skips FastAPI's jsonable_encoder
+        # pass; model_dump() output is already plain JSON-compatible data.
+        return OrjsonResponse(content={
             "facility_analysis": facility_output.model_dump(),
             "region_summary": region_summary.model_dump(),
             "sample_qa": {
@@ -460,7 +797,7 @@ def demo_process_facility(facility_input: dict):
             },
             "trace_id": trace_id,
             "message": f"Complete pipeline executed. View trace at /trace/{trace_id}"
-        }
+        })
         
     except Exception as e:
         end_trace(trace_id)
@@ -468,13 +805,3 @@ def demo_process_facility(facility_input: dict):
             status_code=500,
             detail=f"Processing failed: {str(e)}"
         )
-
-
-@app.get("/health")
-def health_check():
-    """Health check endpoint.
-    
-    Returns:
-        Health status
-    """
-    return {"status": "healthy"}
@@ -3,15 +3,26 @@
 import sys
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-from medlinker_ai.models import FacilityDocInput, FacilityAnalysisOutput
+from pydantic import TypeAdapter
+
+from medlinker_ai.models import FacilityDocInput, FacilityAnalysisOutput, RegionSummary
 from medlinker_ai.extract import extract_capabilities
 from medlinker_ai.verify import verify_facility
 from medlinker_ai.dataset import load_facility_docs_from_csv
 from medlinker_ai.aggregate import aggregate_regions
+from medlinker_ai.config import PARALLEL_VERIFY_MIN_FACILITIES
 from medlinker_ai.qa import answer_planner_question
-from medlinker_ai.trace import get_trace, list_recent_traces
+from medlinker_ai.trace import (
+    get_trace,
+    list_recent_traces,
+    collect_trace_lines,
+    append_trace_lines
+)
+from medlinker_ai.utils import open_data_file, resolve_data_file
 from medlinker_ai.mlflow_utils import (
     start_mlflow_run,
     end_mlflow_run,
@@ -22,6 +33,45 @@ from medlinker_ai.mlflow_utils import (
 )
 
 
+# File suffix for each supported facilities.jsonl compression
+OUTPUT_COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+# Validators/serializers for output files, built once at import
+_facility_adapter = TypeAdapter(FacilityAnalysisOutput)
+_facility_list_adapter = TypeAdapter(List[FacilityAnalysisOutput])
+_region_list_adapter = TypeAdapter(List[RegionSummary])
+
+
+def load_facility_outputs(jsonl_path: str) -> List[FacilityAnalysisOutput]:
+    """Load and validate facility outputs from a JSONL file.
+    
+    The lines are framed into a single JSON array so parsing and validation
+    run in one pydantic-core call.
+    
+    Args:
+        jsonl_path: Path to JSONL file with facility outputs (may be .gz/.zst)
+        
+    Returns:
+        List of facility analysis outputs
+    """
+    with open_data_file(jsonl_path) as f:
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    return _facility_list_adapter.validate_json(b"[" + b",".join(lines) + b"]")
+
+
+def load_region_summaries(json_path: str) -> List[RegionSummary]:
+    """Load and validate region summaries from a JSON file.
+    
+    Args:
+        json_path: Path to regions JSON file
+        
+    Returns:
+        List of region summaries
+    """
+    with open(json_path, 'rb') as f:
+        return _region_list_adapter.validate_json(f.read())
+
+
 def extract_command(input_path: str) -> None:
     """Extract capabilities from facility input JSON.
     
@@ -95,6 +145,55 @@ def verify_command(input_path: str) -> None:
     print(json.dumps(analysis.model_dump(), indent=2))
 
 
+def _verify_facility_task(
+    doc: FacilityDocInput
+) -> Tuple[Optional[FacilityAnalysisOutput], Optional[str]]:
+    """Verify one facility, returning (analysis, None) or (None, error message)."""
+    try:
+        return verify_facility(doc), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _verify_facility_worker(
+    doc: FacilityDocInput
+) -> Tuple[Optional[FacilityAnalysisOutput], Optional[str], List[bytes]]:
+    """Verify one facility in a worker process.
+    
+    Trace lines are returned rather than written, so only the parent process
+    appends to traces.jsonl.
+    """
+    with collect_trace_lines() as trace_lines:
+        analysis, error = _verify_facility_task(doc)
+    return analysis, error, trace_lines
+
+
+def _verify_facilities(
+    facilities: List[FacilityDocInput]
+) -> Iterator[Tuple[Optional[FacilityAnalysisOutput], Optional[str]]]:
+    """Verify facilities in input order, using worker processes for large runs.
+    
+    Worker traces are written by this process as results arrive, in input
+    order. MLflow runs opened by the trace module stay per-process (each
+    worker has its own active run), so they never interleave.
+    
+    Args:
+        facilities: Facility documents to verify
+        
+    Yields:
+        (analysis, error message) per facility, exactly one of which is None
+    """
+    if len(facilities) >= PARALLEL_VERIFY_MIN_FACILITIES:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_verify_facility_worker, facilities, chunksize=4)
+            for analysis, error, trace_lines in results:
+                append_trace_lines(trace_lines)
+                yield analysis, error
+    else:
+        for doc in facilities:
+            yield _verify_facility_task(doc)
+
+
 def run_dataset_command(csv_path: str, limit: int = None) -> None:
     """Run verification on dataset and output JSONL.
     
@@ -102,6 +201,16 @@ def run_dataset_command(csv_path: str, limit: int = None) -> None:
         csv_path: Path to CSV file
         limit: Optional limit on number of rows
     """
+    # Optionally compress the output (OUTPUT_COMPRESSION=gzip|zstd)
+    compression = os.environ.get("OUTPUT_COMPRESSION", "none").lower()
+    if compression not in OUTPUT_COMPRESSION_SUFFIXES:
+        print(
+            f"Error: Unknown OUTPUT_COMPRESSION: {compression}. "
+            f"Valid options: {', '.join(OUTPUT_COMPRESSION_SUFFIXES)}",
+            file=sys.stderr
+        )
+        sys.exit(1)
+    
     # Start MLflow run
     dataset_name = Path(csv_path).stem
     start_mlflow_run(f"dataset_{dataset_name}")
@@ -123,25 +232,26 @@ def run_dataset_command(csv_path: str, limit: int = None) -> None:
     output_dir = Path("./outputs")
     output_dir.mkdir(exist_ok=True)
     
-    output_file = output_dir / "facilities.jsonl"
+    output_file = output_dir / ("facilities.jsonl" + OUTPUT_COMPRESSION_SUFFIXES[compression])
     
     # Process each facility
     print(f"Processing facilities...", file=sys.stderr)
     status_counts = {"VERIFIED": 0, "INCOMPLETE": 0, "SUSPICIOUS": 0}
     
-    with open(output_file, 'w') as f:
-        for i, doc in enumerate(facilities, 1):
-            try:
-                analysis = verify_facility(doc)
-                f.write(json.dumps(analysis.model_dump()) + "\n")
-                
-                # Track status
-                status_counts[analysis.status] = status_counts.get(analysis.status, 0) + 1
-                
-                if i % 10 == 0:
-                    print(f"  Processed {i}/{len(facilities)}", file=sys.stderr)
-            except Exception as e:
-                print(f"  Error processing {doc.facility_id}: {e}", file=sys.stderr)
+    results = _verify_facilities(facilities)
+    with open_data_file(output_file, 'wb') as f:
+        for i, (doc, (analysis, error)) in enumerate(zip(facilities, results), 1):
+            if error is not None:
+                print(f"  Error processing {doc.facility_id}: {error}", file=sys.stderr)
+                continue
+            
+            f.write(_facility_adapter.dump_json(analysis) + b"\n")
+            
+            # Track status
+            status_counts[analysis.status] = status_counts.get(analysis.status, 0) + 1
+            
+            if i % 10 == 0:
+                print(f"  Processed {i}/{len(facilities)}", file=sys.stderr)
     
     print(f"\nOutput written to {output_file}", file=sys.stderr)
     print(f"Processed {len(facilities)} facilities", file=sys.stderr)
@@ -178,14 +288,7 @@ def aggregate_command(jsonl_path: str) -> None:
     
     # Load facility outputs
     print(f"Loading facility outputs from {jsonl_path}...", file=sys.stderr)
-    facility_outputs = []
-    
-    with open(jsonl_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                data = json.loads(line)
-                output = FacilityAnalysisOutput(**data)
-                facility_outputs.append(output)
+    facility_outputs = load_facility_outputs(jsonl_path)
     
     print(f"Loaded {len(facility_outputs)} facility outputs", file=sys.stderr)
     
@@ -198,8 +301,7 @@ def aggregate_command(jsonl_path: str) -> None:
     output_dir.mkdir(exist_ok=True)
     output_file = output_dir / "regions.json"
     
-    with open(output_file, 'w') as f:
-        json.dump([s.model_dump() for s in summaries], f, indent=2)
+    output_file.write_bytes(_region_list_adapter.dump_json(summaries, indent=2))
     
     print(f"\nOutput written to {output_file}", file=sys.stderr)
     print(f"Aggregated {len(summaries)} regions", file=sys.stderr)
@@ -239,20 +341,11 @@ def ask_command(facilities_path: str, regions_path: str, question: str) -> None:
     """
     # Load facilities
     print(f"Loading facilities from {facilities_path}...", file=sys.stderr)
-    facilities = []
-    with open(facilities_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                data = json.loads(line)
-                facilities.append(FacilityAnalysisOutput(**data))
+    facilities = load_facility_outputs(facilities_path)
     
     # Load regions
     print(f"Loading regions from {regions_path}...", file=sys.stderr)
-    with open(regions_path, 'r') as f:
-        regions_data = json.load(f)
-    
-    from medlinker_ai.models import RegionSummary
-    regions = [RegionSummary(**r) for r in regions_data]
+    regions = load_region_summaries(regions_path)
     
     print(f"Loaded {len(facilities)} facilities, {len(regions)} regions", file=sys.stderr)
     
@@ -339,29 +432,20 @@ def build_rag_index_command() -> None:
         sys.exit(1)
     
     # Load facilities
-    facilities_path = Path("outputs/facilities.jsonl")
-    if not facilities_path.exists():
-        print(f"Error: {facilities_path} not found. Run 'run_dataset' first.", file=sys.stderr)
+    facilities_path = resolve_data_file("outputs/facilities.jsonl")
+    if facilities_path is None:
+        print("Error: outputs/facilities.jsonl not found. Run 'run_dataset' first.", file=sys.stderr)
         sys.exit(1)
     
     print(f"Loading facilities from {facilities_path}...", file=sys.stderr)
-    facilities = []
-    with open(facilities_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                data = json.loads(line)
-                facilities.append(FacilityAnalysisOutput(**data))
+    facilities = load_facility_outputs(facilities_path)
     
     # Load regions
     regions_path = Path("outputs/regions.json")
     regions = []
     if regions_path.exists():
         print(f"Loading regions from {regions_path}...", file=sys.stderr)
-        with open(regions_path, 'r') as f:
-            regions_data = json.load(f)
-        
-        from medlinker_ai.models import RegionSummary
-        regions = [RegionSummary(**r) for r in regions_data]
+        regions = load_region_summaries(regions_path)
     
     # Build indexes
     print("Building RAG indexes...", file=sys.stderr)
@@ -371,6 +455,93 @@ def build_rag_index_command() -> None:
     print("To enable RAG retrieval, set: export RAG_ENABLED=1", file=sys.stderr)
 
 
+def _usage_error(usage: str) -> None:
+    """Print a usage line and exit with status 1."""
+    print(f"Usage: python -m medlinker_ai.cli {usage}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _parse_limit(args: List[str], default: Optional[int]) -> Optional[int]:
+    """Parse an optional leading ``--limit N`` flag from args."""
+    if len(args) > 1 and args[0] == "--limit":
+        try:
+            return int(args[1])
+        except ValueError:
+            print("Error: --limit must be an integer", file=sys.stderr)
+            sys.exit(1)
+    return default
+
+
+def _run_extract(args: List[str]) -> None:
+    """Handle: extract <input.json>"""
+    if len(args) < 1:
+        _usage_error("extract <input.json>")
+    extract_command(args[0])
+
+
+def _run_verify(args: List[str]) -> None:
+    """Handle: verify <input.json>"""
+    if len(args) < 1:
+        _usage_error("verify <input.json>")
+    verify_command(args[0])
+
+
+def _run_dataset(args: List[str]) -> None:
+    """Handle: run_dataset <csv> [--limit N]"""
+    if len(args) < 1:
+        _usage_error("run_dataset <csv> [--limit N]")
+    run_dataset_command(args[0], limit=_parse_limit(args[1:], None))
+
+
+def _run_aggregate(args: List[str]) -> None:
+    """Handle: aggregate <jsonl>"""
+    if len(args) < 1:
+        _usage_error("aggregate <jsonl>")
+    aggregate_command(args[0])
+
+
+def _run_ask(args: List[str]) -> None:
+    """Handle: ask <facilities.jsonl> <regions.json> <question>"""
+    if len(args) < 3:
+        _usage_error("ask <facilities.jsonl> <regions.json> <question>")
+    ask_command(args[0], args[1], args[2])
+
+
+def _run_trace(args: List[str]) -> None:
+    """Handle: trace <show|list> [args]"""
+    if len(args) < 1:
+        _usage_error("trace <show|list> [args]")
+    
+    subcommand = args[0]
+    
+    if subcommand == "show":
+        if len(args) < 2:
+            _usage_error("trace show <trace_id>")
+        trace_show_command(args[1])
+    elif subcommand == "list":
+        trace_list_command(limit=_parse_limit(args[1:], 10))
+    else:
+        print(f"Error: Unknown trace subcommand: {subcommand}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _run_build_rag_index(args: List[str]) -> None:
+    """Handle: build_rag_index"""
+    build_rag_index_command()
+
+
+# Command name -> handler taking the arguments after the command name
+_COMMANDS: Dict[str, Callable[[List[str]], None]] = {
+    "extract": _run_extract,
+    "verify": _run_verify,
+    "run_dataset": _run_dataset,
+    "aggregate": _run_aggregate,
+    "ask": _run_ask,
+    "trace": _run_trace,
+    "build_rag_index": _run_build_rag_index,
+}
+
+
 def main() -> None:
     """Main CLI entry point."""
     if len(sys.argv) < 2:
@@ -386,73 +557,13 @@ def main() -> None:
         sys.exit(1)
     
     command = sys.argv[1]
+    handler = _COMMANDS.get(command)
     
-    if command == "extract":
-        if len(sys.argv) < 3:
-            print("Usage: python -m medlinker_ai.cli extract <input.json>", file=sys.stderr)
-            sys.exit(1)
-        extract_command(sys.argv[2])
-    elif command == "verify":
-        if len(sys.argv) < 3:
-            print("Usage: python -m medlinker_ai.cli verify <input.json>", file=sys.stderr)
-            sys.exit(1)
-        verify_command(sys.argv[2])
-    elif command == "run_dataset":
-        if len(sys.argv) < 3:
-            print("Usage: python -m medlinker_ai.cli run_dataset <csv> [--limit N]", file=sys.stderr)
-            sys.exit(1)
-        
-        csv_path = sys.argv[2]
-        limit = None
-        
-        # Parse --limit flag
-        if len(sys.argv) > 3 and sys.argv[3] == "--limit" and len(sys.argv) > 4:
-            try:
-                limit = int(sys.argv[4])
-            except ValueError:
-                print("Error: --limit must be an integer", file=sys.stderr)
-                sys.exit(1)
-        
-        run_dataset_command(csv_path, limit=limit)
-    elif command == "aggregate":
-        if len(sys.argv) < 3:
-            print("Usage: python -m medlinker_ai.cli aggregate <jsonl>", file=sys.stderr)
-            sys.exit(1)
-        aggregate_command(sys.argv[2])
-    elif command == "ask":
-        if len(sys.argv) < 5:
-            print("Usage: python -m medlinker_ai.cli ask <facilities.jsonl> <regions.json> <question>", file=sys.stderr)
-            sys.exit(1)
-        ask_command(sys.argv[2], sys.argv[3], sys.argv[4])
-    elif command == "trace":
-        if len(sys.argv) < 3:
-            print("Usage: python -m medlinker_ai.cli trace <show|list> [args]", file=sys.stderr)
-            sys.exit(1)
-        
-        subcommand = sys.argv[2]
-        
-        if subcommand == "show":
-            if len(sys.argv) < 4:
-                print("Usage: python -m medlinker_ai.cli trace show <trace_id>", file=sys.stderr)
-                sys.exit(1)
-            trace_show_command(sys.argv[3])
-        elif subcommand == "list":
-            limit = 10
-            if len(sys.argv) > 3 and sys.argv[3] == "--limit" and len(sys.argv) > 4:
-                try:
-                    limit = int(sys.argv[4])
-                except ValueError:
-                    print("Error: --limit must be an integer", file=sys.stderr)
-                    sys.exit(1)
-            trace_list_command(limit=limit)
-        else:
-            print(f"Error: Unknown trace subcommand: {subcommand}", file=sys.stderr)
-            sys.exit(1)
-    elif command == "build_rag_index":
-        build_rag_index_command()
-    else:
+    if handler is None:
         print(f"Error: Unknown command: {command}", file=sys.stderr)
         sys.exit(1)
+    
+    handler(sys.argv[2:])
 
 
 if __name__ == "__main__":
@@ -1,25 +1,28 @@
 """Configuration for critical capabilities and thresholds."""
 
+# Critical capability tuples are immutable and ordered: their order defines
+# the order of RegionSummary.missing_critical.
+
 # Critical services that should be available in every region
-CRITICAL_SERVICES = [
+CRITICAL_SERVICES = (
     "c-section",
     "emergency",
     "ultrasound",
     "x-ray",
     "laboratory"
-]
+)
 
 # Critical equipment that should be available in every region
-CRITICAL_EQUIPMENT = [
+CRITICAL_EQUIPMENT = (
     "ultrasound",
     "x-ray"
-]
+)
 
 # Critical staffing that should be available in every region
-CRITICAL_STAFFING = [
+CRITICAL_STAFFING = (
     "midwife",
     "doctor"
-]
+)
 
 # Desert score weights (points per missing critical item)
 DESERT_SCORE_WEIGHTS = {
@@ -30,3 +33,10 @@ DESERT_SCORE_WEIGHTS = {
 
 # Maximum desert score
 MAX_DESERT_SCORE = 100
+
+# Minimum number of regions before aggregation fans out to worker processes
+PARALLEL_AGGREGATION_MIN_REGIONS = 64
+
+# Minimum number of facilities before run_dataset fans verification out to
+# worker processes
+PARALLEL_VERIFY_MIN_FACILITIES = 32
@@ -1,40 +1,102 @@
 """Dataset loading and processing utilities."""
 
 import csv
-import json
-from typing import List, Optional, Any, Dict
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional
+
+import orjson
 
 from medlinker_ai.models import FacilityDocInput
 
 
-def load_coordinates_map(coords_csv_path: str = "Updated_long_and_lat_on_VF_Gh.csv") -> Dict[str, tuple]:
+# Read buffer for CSV files (the default 8 KiB means many small reads)
+CSV_READ_BUFFER_SIZE = 1 << 20
+
+# Placeholder strings treated as missing address values
+_NULL_VALUES = frozenset({"", "null", "none", "n/a"})
+
+
+def normalize_facility_name(name: str) -> str:
+    """Normalize a facility name for matching across CSV files.
+    
+    Args:
+        name: Raw facility name
+        
+    Returns:
+        Lowercased name with whitespace runs collapsed to single spaces
+    """
+    return " ".join(name.lower().split())
+
+
+def _clean_field(value: Optional[str]) -> str:
+    """Strip a CSV cell, mapping placeholder values such as "null" to ""."""
+    value = (value or "").strip()
+    return "" if value.lower() in _NULL_VALUES else value
+
+
+def load_coordinates_map(
+    coords_csv_path: str = "Updated_long_and_lat_on_VF_Gh.csv"
+) -> Mapping[str, tuple]:
     """Load facility coordinates from CSV file.
     
+    Results are cached per path and file modification time, so repeated
+    facility loads against the same coordinates file read it only once and
+    an updated file is picked up automatically. A missing file is not
+    cached. The returned mapping is read-only because it is shared between
+    callers.
+    
     Args:
         coords_csv_path: Path to coordinates CSV file
         
     Returns:
-        Dictionary mapping facility_name to (latitude, longitude)
+        Read-only mapping of normalized facility_name (see
+        normalize_facility_name) to (latitude, longitude)
     """
-    coords_map = {}
-    
     try:
-        with open(coords_csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                facility_name = row.get("facility_name", "").strip()
-                latitude = row.get("latitude", "").strip()
-                longitude = row.get("longitude", "").strip()
-                
-                if facility_name and latitude and longitude:
-                    try:
-                        coords_map[facility_name] = (float(latitude), float(longitude))
-                    except ValueError:
-                        continue
+        stat = os.stat(coords_csv_path)
+        return _load_coordinates_file(coords_csv_path, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         print(f"Warning: Coordinates file {coords_csv_path} not found. Facilities will not have GPS coordinates.")
+        return MappingProxyType({})
+
+
+@lru_cache(maxsize=4)
+def _load_coordinates_file(
+    coords_csv_path: str,
+    mtime_ns: int,
+    size: int
+) -> Mapping[str, tuple]:
+    """Parse a coordinates CSV file (cached on path, mtime and size).
     
-    return coords_map
+    Args:
+        coords_csv_path: Path to coordinates CSV file
+        mtime_ns: File modification time, part of the cache key
+        size: File size in bytes, part of the cache key
+        
+    Returns:
+        Read-only mapping of normalized facility_name to (latitude, longitude)
+    """
+    coords_map = {}
+    
+    with open(coords_csv_path, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER_SIZE) as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            facility_name = row.get("facility_name", "").strip()
+            latitude = row.get("latitude", "").strip()
+            longitude = row.get("longitude", "").strip()
+            
+            if facility_name and latitude and longitude:
+                try:
+                    coords_map[normalize_facility_name(facility_name)] = (
+                        float(latitude), float(longitude)
+                    )
+                except ValueError:
+                    continue
+    
+    return MappingProxyType(coords_map)
 
 
 def safe_parse_json_list(value: str) -> List[str]:
@@ -50,15 +112,24 @@ def safe_parse_json_list(value: str) -> List[str]:
         return []
     
     try:
-        parsed = json.loads(value)
+        parsed = orjson.loads(value)
         if isinstance(parsed, list):
             return [str(item) for item in parsed]
         return [str(parsed)]
-    except (json.JSONDecodeError, ValueError):
+    except orjson.JSONDecodeError:
         # Try splitting by comma as fallback
         return [item.strip() for item in value.split(",") if item.strip()]
 
 
+# (label, CSV column) for cells holding JSON lists, in source text order
+_LIST_FIELDS = (
+    ("Specialties", "specialties"),
+    ("Procedures", "procedure"),
+    ("Equipment", "equipment"),
+    ("Capabilities", "capability"),
+)
+
+
 def build_source_text(row: dict) -> str:
     """Build source text from CSV row fields.
     
@@ -78,25 +149,11 @@ def build_source_text(row: dict) -> str:
     if row.get("location"):
         parts.append(f"Location: {row['location']}")
     
-    # Add specialties
-    specialties = safe_parse_json_list(row.get("specialties", ""))
-    if specialties:
-        parts.append(f"Specialties: {', '.join(specialties)}")
-    
-    # Add procedures
-    procedures = safe_parse_json_list(row.get("procedure", ""))
-    if procedures:
-        parts.append(f"Procedures: {', '.join(procedures)}")
-    
-    # Add equipment
-    equipment = safe_parse_json_list(row.get("equipment", ""))
-    if equipment:
-        parts.append(f"Equipment: {', '.join(equipment)}")
-    
-    # Add capabilities
-    capabilities = safe_parse_json_list(row.get("capability", ""))
-    if capabilities:
-        parts.append(f"Capabilities: {', '.join(capabilities)}")
+    # Add JSON-list fields
+    for label, column in _LIST_FIELDS:
+        items = safe_parse_json_list(row.get(column, ""))
+        if items:
+            parts.append(f"{label}: {', '.join(items)}")
     
     # Add description
     if row.get("description"):
@@ -125,7 +182,7 @@ def load_facility_docs_from_csv(
     
     facilities = []
     
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    with open(csv_path, 'r', encoding='utf-8', newline='', buffering=CSV_READ_BUFFER_SIZE) as f:
         reader = csv.DictReader(f)
         
         for i, row in enumerate(reader):
@@ -144,34 +201,30 @@ def load_facility_docs_from_csv(
             
             # Extract location information
             # Try multiple location fields
-            address_city = row.get("address_city", "").strip()
-            address_region = row.get("address_stateOrRegion", "").strip()
-            address_country = row.get("address_country", "").strip()
-            
-            # Handle "null" string values
-            if address_city.lower() == "null":
-                address_city = ""
-            if address_region.lower() == "null":
-                address_region = ""
-            if address_country.lower() == "null":
-                address_country = ""
+            address_city = _clean_field(row.get("address_city"))
+            address_region = _clean_field(row.get("address_stateOrRegion"))
+            address_country = _clean_field(row.get("address_country"))
             
             # Build region and country
             region = address_region or address_city or "Unknown Region"
             country = address_country or "Ghana"  # Default to Ghana
             
             # Get coordinates from coords map
-            latitude, longitude = coords_map.get(facility_name, (None, None))
+            latitude, longitude = coords_map.get(
+                normalize_facility_name(facility_name), (None, None)
+            )
             
             # Build source text
             source_text = build_source_text(row)
             
-            # Create FacilityDocInput
-            doc = FacilityDocInput(
+            # Create FacilityDocInput; every field is built above with the
+            # right type, so skip validation (interning country/region as
+            # the model's validator would)
+            doc = FacilityDocInput.model_construct(
                 facility_id=facility_id,
                 facility_name=facility_name,
-                country=country,
-                region=region,
+                country=sys.intern(country),
+                region=sys.intern(region),
                 source_id=f"csv_row_{i+1}",
                 source_type="dataset_row",
                 source_text=source_text,
@@ -1,21 +1,32 @@
 """Capability extraction logic for MedLinker AI with strict validation."""
 
-import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from medlinker_ai.models import (
     FacilityDocInput,
     CapabilitySchemaV0,
     Citation,
 )
-from medlinker_ai.llm import get_llm_client
+from medlinker_ai.llm import LLMClient, get_llm_client
 from medlinker_ai.llm.fallback import FallbackClient
 from medlinker_ai.prompts import build_gemini_prompt, build_retry_prompt
 from medlinker_ai.trace import log_span
 
 
+# Validates a whole citations array in one pydantic-core call
+_citation_list_adapter = TypeAdapter(List[Citation])
+
+# Capability fields a citation may reference (besides "flag:*" entries)
+VALID_CITATION_FIELDS = frozenset({
+    "services", "equipment", "staffing", "hours",
+    "referral_capacity", "emergency_capability"
+})
+
+
 def verify_citation_snippets(
     citations: list[Citation],
     source_text: str
@@ -68,20 +79,16 @@ def validate_extraction_output(
         raise ValueError(f"Invalid extracted_capabilities schema: {e}")
     
     try:
-        citations = [Citation(**c) for c in response_data["citations"]]
+        citations = _citation_list_adapter.validate_python(response_data["citations"])
     except ValidationError as e:
         raise ValueError(f"Invalid citation schema: {e}")
     
     # Verify citation fields are valid
-    valid_fields = {
-        "services", "equipment", "staffing", "hours",
-        "referral_capacity", "emergency_capability"
-    }
     for citation in citations:
-        if citation.field not in valid_fields and not citation.field.startswith("flag:"):
+        if citation.field not in VALID_CITATION_FIELDS and not citation.field.startswith("flag:"):
             raise ValueError(
                 f"Invalid citation field: {citation.field}. "
-                f"Must be one of: {valid_fields}"
+                f"Must be one of: {set(VALID_CITATION_FIELDS)}"
             )
     
     # Verify citation snippets exist in source text
@@ -137,31 +144,33 @@ def extract_capabilities(
     
     # If using fallback, skip strict validation
     if isinstance(client, FallbackClient):
-        response_text = client.extract(doc.source_text)
-        response_data = json.loads(response_text)
-        capabilities = CapabilitySchemaV0(**response_data["extracted_capabilities"])
-        citations = [Citation(**c) for c in response_data["citations"]]
-        
-        # Log trace span
-        if trace_id:
-            log_span(
-                trace_id=trace_id,
-                step_name="extract",
-                inputs_summary={
-                    "facility_id": doc.facility_id,
-                    "source_id": doc.source_id,
-                    "source_type": doc.source_type
-                },
-                outputs_summary={
-                    "services_count": len(capabilities.services),
-                    "equipment_count": len(capabilities.equipment),
-                    "staffing_count": len(capabilities.staffing)
-                },
-                evidence_refs=len(citations)
-            )
-        
-        return capabilities, citations
+        capabilities, citations = _extract_offline(client, doc)
+    else:
+        capabilities, citations = _extract_with_retry(client, doc)
     
+    # Log trace span
+    if trace_id:
+        _emit_extract_span(trace_id, doc, capabilities, citations)
+    
+    return capabilities, citations
+
+
+def _extract_offline(
+    client: FallbackClient,
+    doc: FacilityDocInput
+) -> tuple[CapabilitySchemaV0, list[Citation]]:
+    """Run the offline extractor without strict validation."""
+    response_data = client.extract_dict(doc.source_text)
+    capabilities = CapabilitySchemaV0(**response_data["extracted_capabilities"])
+    citations = _citation_list_adapter.validate_python(response_data["citations"])
+    return capabilities, citations
+
+
+def _extract_with_retry(
+    client: LLMClient,
+    doc: FacilityDocInput
+) -> tuple[CapabilitySchemaV0, list[Citation]]:
+    """Run strict LLM extraction, retrying once before falling back offline."""
     # Build strict prompt for LLM
     prompt = build_gemini_prompt(
         facility_id=doc.facility_id,
@@ -179,35 +188,15 @@ def extract_capabilities(
         
         # Parse JSON
         try:
-            response_data = json.loads(response_text)
-        except json.JSONDecodeError as e:
+            response_data = orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
         
         # Validate with strict rules
-        capabilities, citations = validate_extraction_output(
+        return validate_extraction_output(
             response_data, doc.source_text, doc.source_id
         )
         
-        # Log trace span
-        if trace_id:
-            log_span(
-                trace_id=trace_id,
-                step_name="extract",
-                inputs_summary={
-                    "facility_id": doc.facility_id,
-                    "source_id": doc.source_id,
-                    "source_type": doc.source_type
-                },
-                outputs_summary={
-                    "services_count": len(capabilities.services),
-                    "equipment_count": len(capabilities.equipment),
-                    "staffing_count": len(capabilities.staffing)
-                },
-                evidence_refs=len(citations)
-            )
-        
-        return capabilities, citations
-        
     except (ValueError, ValidationError) as first_error:
         # Retry once with error details
         error_details = str(first_error)
@@ -222,22 +211,66 @@ def extract_capabilities(
             
             # Parse JSON
             try:
-                response_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
+                response_data = orjson.loads(response_text)
+            except orjson.JSONDecodeError as e:
                 raise ValueError(f"Retry failed - Invalid JSON: {e}")
             
             # Validate with strict rules
-            capabilities, citations = validate_extraction_output(
+            return validate_extraction_output(
                 response_data, doc.source_text, doc.source_id
             )
             
-            return capabilities, citations
-            
-        except (ValueError, ValidationError) as retry_error:
+        except (ValueError, ValidationError):
             # Both attempts failed - fall back to offline extractor
-            fallback_client = FallbackClient()
-            response_text = fallback_client.extract(doc.source_text)
-            response_data = json.loads(response_text)
-            capabilities = CapabilitySchemaV0(**response_data["extracted_capabilities"])
-            citations = [Citation(**c) for c in response_data["citations"]]
-            return capabilities, citations
+            return _extract_offline(FallbackClient(), doc)
+
+
+def _emit_extract_span(
+    trace_id: str,
+    doc: FacilityDocInput,
+    capabilities: CapabilitySchemaV0,
+    citations: list[Citation]
+) -> None:
+    """Log the trace span for a completed extraction."""
+    log_span(
+        trace_id=trace_id,
+        step_name="extract",
+        inputs_summary={
+            "facility_id": doc.facility_id,
+            "source_id": doc.source_id,
+            "source_type": doc.source_type
+        },
+        outputs_summary={
+            "services_count": len(capabilities.services),
+            "equipment_count": len(capabilities.equipment),
+            "staffing_count": len(capabilities.staffing)
+        },
+        evidence_refs=len(citations)
+    )
+
+
+def extract_capabilities_batch(
+    docs: list[FacilityDocInput],
+    llm_provider: Optional[str] = None,
+    concurrency: int = 16
+) -> list[tuple[CapabilitySchemaV0, list[Citation]]]:
+    """Extract capabilities for many documents with overlapping LLM calls.
+    
+    LLM requests are network-bound and release the GIL while waiting, so
+    documents are extracted on a thread pool sharing one client.
+    
+    Args:
+        docs: Input facility documents.
+        llm_provider: Optional LLM provider override ("gemini", "openai", "none").
+        concurrency: Maximum number of documents extracted at once.
+        
+    Returns:
+        List of (extracted capabilities, citations list), in input order.
+    """
+    if concurrency <= 1 or len(docs) <= 1:
+        return [extract_capabilities(doc, llm_provider) for doc in docs]
+    
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(docs))) as executor:
+        return list(executor.map(
+            lambda doc: extract_capabilities(doc, llm_provider), docs
+        ))
@@ -5,6 +5,7 @@ agentic orchestration. All logic remains in the original modules - this
 is purely an orchestration layer.
 """
 
+from functools import lru_cache
 from typing import TypedDict, List, Optional, Any
 from langgraph.graph import StateGraph, END
 
@@ -56,14 +57,14 @@ class QAState(TypedDict):
 
 
 # Node functions - thin wrappers around existing functions
-def extract_node(state: ExtractionState) -> ExtractionState:
+def extract_node(state: ExtractionState) -> dict:
     """Extract capabilities from facility document.
     
     Args:
         state: Current extraction state
         
     Returns:
-        Updated state with capabilities and citations
+        State update with capabilities and citations
     """
     capabilities, citations = extract_capabilities(
         state["facility_doc"],
@@ -72,20 +73,19 @@ def extract_node(state: ExtractionState) -> ExtractionState:
     )
     
     return {
-        **state,
         "capabilities": capabilities,
         "citations": citations
     }
 
 
-def verify_node(state: VerificationState) -> VerificationState:
+def verify_node(state: VerificationState) -> dict:
     """Verify facility and detect inconsistencies.
     
     Args:
         state: Current verification state
         
     Returns:
-        Updated state with analysis output
+        State update with analysis output
     """
     analysis = verify_facility(
         state["facility_doc"],
@@ -93,36 +93,34 @@ def verify_node(state: VerificationState) -> VerificationState:
     )
     
     return {
-        **state,
         "analysis": analysis
     }
 
 
-def aggregate_node(state: AggregationState) -> AggregationState:
+def aggregate_node(state: AggregationState) -> dict:
     """Aggregate facilities into regional summaries.
     
     Args:
         state: Current aggregation state
         
     Returns:
-        Updated state with region summaries
+        State update with region summaries
     """
     summaries = aggregate_regions(state["facility_outputs"])
     
     return {
-        **state,
         "region_summaries": summaries
     }
 
 
-def answer_node(state: QAState) -> QAState:
+def answer_node(state: QAState) -> dict:
     """Answer planner question with grounded response.
     
     Args:
         state: Current Q&A state
         
     Returns:
-        Updated state with answer and citations
+        State update with answer and citations
     """
     result = answer_planner_question(
         state["question"],
@@ -132,14 +130,15 @@ def answer_node(state: QAState) -> QAState:
     )
     
     return {
-        **state,
         "answer": result["answer"],
         "citations": result["citations"],
         "trace_id": result["trace_id"]
     }
 
 
-# Graph builders
+# Graph builders (graphs are static, so each is compiled once and reused;
+# per-run data travels in the state passed to invoke)
+@lru_cache(maxsize=None)
 def build_extraction_graph() -> StateGraph:
     """Build LangGraph for extraction flow.
     
@@ -160,6 +159,7 @@ def build_extraction_graph() -> StateGraph:
     return graph.compile()
 
 
+@lru_cache(maxsize=None)
 def build_verification_graph() -> StateGraph:
     """Build LangGraph for verification flow.
     
@@ -180,6 +180,7 @@ def build_verification_graph() -> StateGraph:
     return graph.compile()
 
 
+@lru_cache(maxsize=None)
 def build_aggregation_graph() -> StateGraph:
     """Build LangGraph for aggregation flow.
     
@@ -200,6 +201,7 @@ def build_aggregation_graph() -> StateGraph:
     return graph.compile()
 
 
+@lru_cache(maxsize=None)
 def build_qa_graph() -> StateGraph:
     """Build LangGraph for Q&A flow.
     
@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+import orjson
+
 
 class LLMClient(ABC):
     """Abstract interface for LLM providers."""
@@ -20,3 +22,17 @@ class LLMClient(ABC):
             Exception: If the LLM call fails.
         """
         pass
+    
+    def extract_dict(self, prompt: str) -> dict:
+        """Extract structured data from prompt as a parsed dictionary.
+        
+        Args:
+            prompt: The extraction prompt containing source text and instructions.
+            
+        Returns:
+            Parsed JSON response from the LLM.
+            
+        Raises:
+            orjson.JSONDecodeError: If the response is not valid JSON.
+        """
+        return orjson.loads(self.extract(prompt))
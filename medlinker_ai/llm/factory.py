@@ -1,22 +1,34 @@
 """Factory for creating LLM clients based on configuration."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 from medlinker_ai.llm.base import LLMClient
 from medlinker_ai.llm.fallback import FallbackClient
 
 
+# Environment variables holding each provider's (API key, model name)
+_PROVIDER_ENV = {
+    "gemini": ("GEMINI_API_KEY", "GEMINI_MODEL"),
+    "openai": ("OPENAI_API_KEY", "OPENAI_MODEL"),
+}
+
+
 def get_llm_client(provider: Optional[str] = None) -> LLMClient:
     """Get LLM client based on provider configuration.
     
+    Clients are reused for as long as the provider's API key and model
+    settings stay the same, so SDK setup and HTTP connections are shared
+    across documents.
+    
     Args:
         provider: LLM provider name ("gemini", "openai", "none").
                  Defaults to LLM_PROVIDER env var or "gemini".
     
     Returns:
         Configured LLM client instance.
-        
+    
     Raises:
         ValueError: If provider is unknown or required credentials are missing.
     """
@@ -24,36 +36,45 @@ def get_llm_client(provider: Optional[str] = None) -> LLMClient:
     provider = provider.lower()
     
     if provider == "none":
-        return FallbackClient()
+        return _build_client(provider, None, None)
     
-    elif provider == "gemini":
-        # Check if API key is available
-        if not os.getenv("GEMINI_API_KEY"):
-            # Fall back to offline mode
-            return FallbackClient()
-        
-        try:
-            from medlinker_ai.llm.gemini import GeminiClient
-            return GeminiClient()
-        except (ImportError, ValueError):
-            # Fall back if SDK not installed or key missing
-            return FallbackClient()
-    
-    elif provider == "openai":
-        # Check if API key is available
-        if not os.getenv("OPENAI_API_KEY"):
-            # Fall back to offline mode
-            return FallbackClient()
-        
-        try:
-            from medlinker_ai.llm.openai import OpenAIClient
-            return OpenAIClient()
-        except (ImportError, ValueError):
-            # Fall back if SDK not installed or key missing
-            return FallbackClient()
-    
-    else:
+    if provider not in _PROVIDER_ENV:
         raise ValueError(
             f"Unknown LLM provider: {provider}. "
             f"Valid options: 'gemini', 'openai', 'none'"
         )
+    
+    key_var, model_var = _PROVIDER_ENV[provider]
+    return _build_client(provider, os.getenv(key_var), os.getenv(model_var))
+
+
+@lru_cache(maxsize=8)
+def _build_client(
+    provider: str,
+    api_key: Optional[str],
+    model: Optional[str]
+) -> LLMClient:
+    """Create an LLM client for a resolved provider configuration.
+    
+    Args:
+        provider: Lowercased provider name
+        api_key: Provider API key, if set
+        model: Provider model override, if set
+    
+    Returns:
+        Configured LLM client instance (FallbackClient when unavailable).
+    """
+    # Fall back to offline mode without an API key
+    if provider == "none" or not api_key:
+        return FallbackClient()
+    
+    try:
+        if provider == "gemini":
+            from medlinker_ai.llm.gemini import GeminiClient
+            return GeminiClient(api_key=api_key, model=model)
+        
+        from medlinker_ai.llm.openai import OpenAIClient
+        return OpenAIClient(api_key=api_key, model=model)
+    except (ImportError, ValueError):
+        # Fall back if SDK not installed or key missing
+        return FallbackClient()
@@ -1,12 +1,51 @@
 """Offline fallback extraction using heuristics."""
 
 import re
-import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+import orjson
 
 from medlinker_ai.llm.base import LLMClient
 
 
+def _compile_keyword_patterns(keywords: List[str]) -> Tuple[re.Pattern, re.Pattern]:
+    """Compile keywords into a single word-bounded alternation.
+    
+    Each keyword gets its own capture group, so ``match.lastindex - 1`` is
+    the index of the keyword that matched.
+    
+    Returns:
+        (str pattern, bytes pattern) for the same ASCII keywords; the bytes
+        form scans ASCII-encoded text without Unicode case folding
+    """
+    alternation = "|".join(f"({re.escape(keyword)})" for keyword in keywords)
+    pattern = rf"\b(?:{alternation})\b"
+    return (
+        re.compile(pattern, re.IGNORECASE),
+        re.compile(pattern.encode("ascii"), re.IGNORECASE)
+    )
+
+
+def _make_citation(
+    text: str, span: Tuple[int, int], field_name: str, window: int = 50
+) -> Dict[str, Any]:
+    """Build a citation for a match span with ``window`` chars of context per side."""
+    match_start, match_end = span
+    snippet = text[max(0, match_start - window):match_end + window].strip()
+    
+    # Ensure snippet is <= 500 chars
+    if len(snippet) > 500:
+        snippet = snippet[:497] + "..."
+    
+    return {
+        "source_id": "fallback_extraction",
+        "snippet": snippet,
+        "field": field_name,
+        "start_char": match_start,
+        "end_char": match_end
+    }
+
+
 class FallbackClient(LLMClient):
     """Offline heuristic-based extraction (no LLM required)."""
     
@@ -31,6 +70,11 @@ class FallbackClient(LLMClient):
         "laboratory technician", "lab technician", "radiographer"
     ]
     
+    # Compiled once so each list field is found in a single scan of the text
+    SERVICES_PATTERNS = _compile_keyword_patterns(SERVICES_KEYWORDS)
+    EQUIPMENT_PATTERNS = _compile_keyword_patterns(EQUIPMENT_KEYWORDS)
+    STAFFING_PATTERNS = _compile_keyword_patterns(STAFFING_KEYWORDS)
+    
     HOURS_PATTERNS = [
         r"24/7",
         r"24\s*hours",
@@ -47,6 +91,19 @@ class FallbackClient(LLMClient):
     
     EMERGENCY_KEYWORDS = ["emergency", "er ", "accident & emergency", "a&e", "24/7"]
     
+    # Precompiled hours patterns and case-insensitive literal keyword
+    # patterns for referral/emergency detection
+    HOURS_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in HOURS_PATTERNS]
+    
+    # Every hours pattern needs one of these substrings (lowercased) to match
+    HOURS_HINTS = ("24/7", "hour", "mon", "am", "pm", "weekday")
+    LITERAL_KEYWORD_REGEXES = {
+        keyword: re.compile(re.escape(keyword), re.IGNORECASE)
+        for keyword in (
+            REFERRAL_KEYWORDS["ADVANCED"] + REFERRAL_KEYWORDS["BASIC"] + EMERGENCY_KEYWORDS
+        )
+    }
+    
     def extract(self, prompt: str) -> str:
         """Extract using regex heuristics.
         
@@ -56,36 +113,58 @@ class FallbackClient(LLMClient):
         Returns:
             JSON string with extracted_capabilities and citations.
         """
+        return orjson.dumps(self.extract_dict(prompt)).decode()
+    
+    def extract_dict(self, prompt: str) -> dict:
+        """Extract using regex heuristics, without a JSON round-trip.
+        
+        Args:
+            prompt: Contains the source text to extract from.
+            
+        Returns:
+            Dictionary with extracted_capabilities and citations.
+        """
         # Extract source text from prompt (it's embedded in the prompt)
         # For simplicity, assume the entire prompt is the source text
         # In practice, we'd parse it from the structured prompt
         source_text = prompt
         
+        # Lowercased once for the substring checks shared by the extractors
+        text_lower = source_text.lower()
+        
+        # ASCII text (the common case) is also kept as bytes for the keyword
+        # scans; character and byte offsets coincide
+        text_ascii = source_text.encode("ascii") if source_text.isascii() else None
+        
         # Extract capabilities
         services, service_citations = self._extract_list_field(
-            source_text, self.SERVICES_KEYWORDS, "services"
+            source_text, text_ascii, self.SERVICES_KEYWORDS, self.SERVICES_PATTERNS, "services"
         )
         
         equipment, equipment_citations = self._extract_list_field(
-            source_text, self.EQUIPMENT_KEYWORDS, "equipment"
+            source_text, text_ascii, self.EQUIPMENT_KEYWORDS, self.EQUIPMENT_PATTERNS, "equipment"
         )
         
         staffing, staffing_citations = self._extract_list_field(
-            source_text, self.STAFFING_KEYWORDS, "staffing"
+            source_text, text_ascii, self.STAFFING_KEYWORDS, self.STAFFING_PATTERNS, "staffing"
         )
         
-        hours, hours_citations = self._extract_hours(source_text)
-        
-        referral_capacity, referral_citations = self._extract_referral_capacity(source_text)
+        hours, hours_citations = self._extract_hours(source_text, text_lower)
         
-        emergency_capability, emergency_citations = self._extract_emergency_capability(source_text)
+        referral_capacity, referral_citations = self._extract_referral_capacity(
+            source_text, text_lower
+        )
         
-        # Combine all citations
-        all_citations = (
-            service_citations + equipment_citations + staffing_citations +
-            hours_citations + referral_citations + emergency_citations
+        emergency_capability, emergency_citations = self._extract_emergency_capability(
+            source_text, text_lower
         )
         
+        # Combine all citations into a single new list
+        all_citations = [
+            *service_citations, *equipment_citations, *staffing_citations,
+            *hours_citations, *referral_citations, *emergency_citations
+        ]
+        
         result = {
             "extracted_capabilities": {
                 "services": services,
@@ -98,153 +177,123 @@ class FallbackClient(LLMClient):
             "citations": all_citations
         }
         
-        return json.dumps(result, indent=2)
+        return result
     
     def _extract_list_field(
-        self, text: str, keywords: List[str], field_name: str
+        self,
+        text: str,
+        text_ascii: Optional[bytes],
+        keywords: List[str],
+        patterns: Tuple[re.Pattern, re.Pattern],
+        field_name: str
     ) -> tuple[List[str], List[Dict[str, Any]]]:
-        """Extract list field using keyword matching."""
+        """Extract list field using keyword matching.
+        
+        ``patterns`` are the keywords' combined alternations (see
+        _compile_keyword_patterns); ``text_ascii`` is the ASCII-encoded text,
+        or None if it is not ASCII. Items keep the keyword list order.
+        """
+        str_pattern, bytes_pattern = patterns
+        if text_ascii is not None:
+            matches = bytes_pattern.finditer(text_ascii)
+        else:
+            matches = str_pattern.finditer(text)
+        
         found_items = []
+        seen_items = set()
         citations = []
-        text_lower = text.lower()
         
-        for keyword in keywords:
-            pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
-            match = pattern.search(text)
+        # First occurrence of each keyword, from a single scan of the text
+        first_matches = {}
+        for match in matches:
+            first_matches.setdefault(match.lastindex - 1, match)
+        
+        for index, keyword in enumerate(keywords):
+            match = first_matches.get(index)
             
             if match:
                 # Capitalize first letter of each word for display
                 item = keyword.title()
-                if item not in found_items:
+                if item not in seen_items:
+                    seen_items.add(item)
                     found_items.append(item)
-                    
-                    # Create citation with context window
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    snippet = text[start:end].strip()
-                    
-                    # Ensure snippet is <= 500 chars
-                    if len(snippet) > 500:
-                        snippet = snippet[:497] + "..."
-                    
-                    citations.append({
-                        "source_id": "fallback_extraction",
-                        "snippet": snippet,
-                        "field": field_name,
-                        "start_char": match.start(),
-                        "end_char": match.end()
-                    })
+                    citations.append(_make_citation(text, match.span(), field_name))
         
         return found_items, citations
     
-    def _extract_hours(self, text: str) -> tuple[str | None, List[Dict[str, Any]]]:
-        """Extract operating hours."""
+    def _find_keyword(
+        self, text: str, text_lower: str, keyword: str
+    ) -> Optional[Tuple[int, int]]:
+        """Find the first case-insensitive occurrence of a literal keyword.
+        
+        Returns:
+            (start, end) offsets into ``text``, or None if absent
+        """
+        if len(text_lower) == len(text):
+            start = text_lower.find(keyword)
+            return (start, start + len(keyword)) if start >= 0 else None
+        
+        # lower() expanded some characters (e.g. "İ"), so offsets in
+        # text_lower no longer line up with text
+        match = self.LITERAL_KEYWORD_REGEXES[keyword].search(text)
+        return match.span() if match else None
+    
+    def _extract_hours(
+        self, text: str, text_lower: str
+    ) -> tuple[str | None, List[Dict[str, Any]]]:
+        """Extract operating hours (``text_lower`` is ``text.lower()``)."""
         citations = []
         
-        for pattern in self.HOURS_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        # Skip the regex scans when no pattern can possibly match
+        if not any(hint in text_lower for hint in self.HOURS_HINTS):
+            return None, citations
+        
+        for pattern in self.HOURS_REGEXES:
+            match = pattern.search(text)
             if match:
                 hours_text = match.group(0)
                 
-                # Create citation
-                start = max(0, match.start() - 30)
-                end = min(len(text), match.end() + 30)
-                snippet = text[start:end].strip()
-                
-                if len(snippet) > 500:
-                    snippet = snippet[:497] + "..."
-                
-                citations.append({
-                    "source_id": "fallback_extraction",
-                    "snippet": snippet,
-                    "field": "hours",
-                    "start_char": match.start(),
-                    "end_char": match.end()
-                })
+                citations.append(_make_citation(text, match.span(), "hours", window=30))
                 
                 return hours_text, citations
         
         return None, citations
     
     def _extract_referral_capacity(
-        self, text: str
+        self, text: str, text_lower: str
     ) -> tuple[str, List[Dict[str, Any]]]:
-        """Extract referral capacity."""
-        text_lower = text.lower()
+        """Extract referral capacity (``text_lower`` is ``text.lower()``)."""
         citations = []
         
         # Check for ADVANCED first
         for keyword in self.REFERRAL_KEYWORDS["ADVANCED"]:
-            if keyword in text_lower:
-                match = re.search(re.escape(keyword), text, re.IGNORECASE)
-                if match:
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    snippet = text[start:end].strip()
-                    
-                    if len(snippet) > 500:
-                        snippet = snippet[:497] + "..."
-                    
-                    citations.append({
-                        "source_id": "fallback_extraction",
-                        "snippet": snippet,
-                        "field": "referral_capacity",
-                        "start_char": match.start(),
-                        "end_char": match.end()
-                    })
-                    
-                    return "ADVANCED", citations
+            span = self._find_keyword(text, text_lower, keyword)
+            if span:
+                citations.append(_make_citation(text, span, "referral_capacity"))
+                
+                return "ADVANCED", citations
         
         # Check for BASIC
         for keyword in self.REFERRAL_KEYWORDS["BASIC"]:
-            if keyword in text_lower:
-                match = re.search(re.escape(keyword), text, re.IGNORECASE)
-                if match:
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    snippet = text[start:end].strip()
-                    
-                    if len(snippet) > 500:
-                        snippet = snippet[:497] + "..."
-                    
-                    citations.append({
-                        "source_id": "fallback_extraction",
-                        "snippet": snippet,
-                        "field": "referral_capacity",
-                        "start_char": match.start(),
-                        "end_char": match.end()
-                    })
-                    
-                    return "BASIC", citations
+            span = self._find_keyword(text, text_lower, keyword)
+            if span:
+                citations.append(_make_citation(text, span, "referral_capacity"))
+                
+                return "BASIC", citations
         
         return "UNKNOWN", citations
     
     def _extract_emergency_capability(
-        self, text: str
+        self, text: str, text_lower: str
     ) -> tuple[str, List[Dict[str, Any]]]:
-        """Extract emergency capability."""
-        text_lower = text.lower()
+        """Extract emergency capability (``text_lower`` is ``text.lower()``)."""
         citations = []
         
         for keyword in self.EMERGENCY_KEYWORDS:
-            if keyword in text_lower:
-                match = re.search(re.escape(keyword), text, re.IGNORECASE)
-                if match:
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    snippet = text[start:end].strip()
-                    
-                    if len(snippet) > 500:
-                        snippet = snippet[:497] + "..."
-                    
-                    citations.append({
-                        "source_id": "fallback_extraction",
-                        "snippet": snippet,
-                        "field": "emergency_capability",
-                        "start_char": match.start(),
-                        "end_char": match.end()
-                    })
-                    
-                    return "YES", citations
+            span = self._find_keyword(text, text_lower, keyword)
+            if span:
+                citations.append(_make_citation(text, span, "emergency_capability"))
+                
+                return "YES", citations
         
         return "UNKNOWN", citations
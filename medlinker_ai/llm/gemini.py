@@ -5,6 +5,13 @@ from typing import Optional
 
 from medlinker_ai.llm.base import LLMClient
 
+# Try to import Gemini SDK (optional)
+try:
+    import google.generativeai as genai
+    GEMINI_AVAILABLE = True
+except ImportError:
+    GEMINI_AVAILABLE = False
+
 
 class GeminiClient(LLMClient):
     """Gemini API client for capability extraction with strict JSON enforcement."""
@@ -23,17 +30,15 @@ class GeminiClient(LLMClient):
         # Try different model names (API has changed)
         self.model = model or os.getenv("GEMINI_MODEL", "gemini-pro")
         
-        # Import Gemini SDK
-        try:
-            import google.generativeai as genai
-            self.genai = genai
-            self.genai.configure(api_key=self.api_key)
-            self.client = self.genai.GenerativeModel(self.model)
-        except ImportError:
+        if not GEMINI_AVAILABLE:
             raise ImportError(
                 "google-generativeai package required for Gemini provider. "
                 "Install with: pip install google-generativeai"
             )
+        
+        self.genai = genai
+        self.genai.configure(api_key=self.api_key)
+        self.client = self.genai.GenerativeModel(self.model)
     
     def extract(self, prompt: str) -> str:
         """Extract structured data using Gemini API with strict JSON output.
@@ -1,11 +1,19 @@
 """OpenAI LLM provider implementation."""
 
 import os
-import json
 from typing import Optional
 
+import orjson
+
 from medlinker_ai.llm.base import LLMClient
 
+# Try to import OpenAI SDK (optional)
+try:
+    from openai import OpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
 
 class OpenAIClient(LLMClient):
     """OpenAI API client for capability extraction."""
@@ -23,65 +31,62 @@ class OpenAIClient(LLMClient):
         
         self.model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         
-        # Import OpenAI SDK
-        try:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=self.api_key)
-        except ImportError:
+        if not OPENAI_AVAILABLE:
             raise ImportError(
                 "openai package required for OpenAI provider. "
                 "Install with: pip install openai"
             )
+        
+        self.client = OpenAI(api_key=self.api_key)
     
     def extract(self, prompt: str) -> str:
         """Extract structured data using OpenAI API.
         
+        JSON mode should always produce valid JSON; if the content still
+        fails to parse, the request is retried once with a clarification.
+        API errors (rate limits, network) propagate without a retry.
+        
         Args:
             prompt: The extraction prompt.
             
         Returns:
             JSON string response from OpenAI.
         """
+        content = self._complete(prompt)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a healthcare data extraction assistant. Return only valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,
-                response_format={"type": "json_object"}
+            orjson.loads(content)
+            return content
+        except orjson.JSONDecodeError:
+            retry_prompt = (
+                f"{prompt}\n\n"
+                "IMPORTANT: Your previous response had JSON formatting issues. "
+                "Please return ONLY valid JSON with no markdown formatting, "
+                "no code blocks, and no extra text."
             )
-            return response.choices[0].message.content
-        except Exception as e:
-            # If JSON parsing fails, try one retry with clarification
-            if "json" in str(e).lower() or "parse" in str(e).lower():
-                retry_prompt = (
-                    f"{prompt}\n\n"
-                    "IMPORTANT: Your previous response had JSON formatting issues. "
-                    "Please return ONLY valid JSON with no markdown formatting, "
-                    "no code blocks, and no extra text."
-                )
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a healthcare data extraction assistant. Return only valid JSON."
-                        },
-                        {
-                            "role": "user",
-                            "content": retry_prompt
-                        }
-                    ],
-                    temperature=0.1,
-                    response_format={"type": "json_object"}
-                )
-                return response.choices[0].message.content
-            raise
+            return self._complete(retry_prompt)
+    
+    def _complete(self, prompt: str) -> str:
+        """Send one JSON-mode chat completion request.
+        
+        Args:
+            prompt: The user prompt.
+            
+        Returns:
+            Message content of the first choice ("" if none).
+        """
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a healthcare data extraction assistant. Return only valid JSON."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.1,
+            response_format={"type": "json_object"}
+        )
+        return response.choices[0].message.content or ""
@@ -1,12 +1,17 @@
 """Uvicorn entry point for MedLinker AI API."""
 
-import uvicorn
+import os
 
 
 if __name__ == "__main__":
+    import uvicorn
+    
+    # Event loop and HTTP parser stay on uvicorn's "auto" setting, which
+    # picks uvloop and httptools when installed (uvicorn[standard])
     uvicorn.run(
         "medlinker_ai.api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=os.environ.get("RELOAD", "0") == "1",
+        workers=int(os.environ.get("WORKERS", "1"))
     )
@@ -6,6 +6,8 @@ or not configured.
 """
 
 import os
+import threading
+import time
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
@@ -13,11 +15,25 @@ from pathlib import Path
 # Try to import MLflow, but don't fail if not installed
 try:
     import mlflow
+    from mlflow.entities import Metric, Param, RunTag
+    from mlflow.tracking import MlflowClient
     MLFLOW_AVAILABLE = True
 except ImportError:
     MLFLOW_AVAILABLE = False
 
 
+# MLflow log_batch limits per request
+MAX_BATCH_PARAMS = 100
+MAX_BATCH_TAGS = 100
+MAX_BATCH_METRICS = 1000
+MAX_BATCH_ENTITIES = 1000
+
+# Run started by this thread (run_id) and its buffered params, tags and metric
+# history, sent to the tracking server with log_batch. Thread-local so that
+# concurrent requests never share or clear each other's buffers.
+_run_state = threading.local()
+
+
 def is_mlflow_enabled() -> bool:
     """Check if MLflow is available and should be used.
     
@@ -49,8 +65,10 @@ def start_mlflow_run(run_name: str, experiment_name: str = "MedLinker-AI") -> Op
         # Set experiment (creates if doesn't exist)
         mlflow.set_experiment(experiment_name)
         
-        # Start run
         run = mlflow.start_run(run_name=run_name)
+        
+        # Buffer everything logged from this thread for this run
+        _reset_run_state(run.info.run_id)
         return run
     except Exception as e:
         # Fail silently - don't crash the pipeline
@@ -59,21 +77,114 @@ def start_mlflow_run(run_name: str, experiment_name: str = "MedLinker-AI") -> Op
 
 
 def end_mlflow_run() -> None:
-    """End the current MLflow run.
+    """End the MLflow run started by start_mlflow_run in this thread.
     
-    Safe to call even if no run is active.
+    Buffered params, metrics and tags are flushed to that run first, even if
+    it was already ended elsewhere. Safe to call even if no run is active.
     """
     if not is_mlflow_enabled():
         return
     
+    run_id = getattr(_run_state, "run_id", None)
+    
     try:
-        mlflow.end_run()
+        _flush_run_data()
+    except Exception as e:
+        print(f"Warning: Failed to flush MLflow run data: {e}")
+    finally:
+        _reset_run_state(None)
+    
+    try:
+        # Only end the active run if it is ours
+        active_run = mlflow.active_run()
+        if active_run is not None and active_run.info.run_id == run_id:
+            mlflow.end_run()
     except Exception as e:
         print(f"Warning: Failed to end MLflow run: {e}")
 
 
+def _reset_run_state(run_id: Optional[str]) -> None:
+    """Point this thread's buffer at run_id and drop anything buffered.
+    
+    Args:
+        run_id: MLflow run ID to buffer for, or None when no run is open
+    """
+    _run_state.run_id = run_id
+    _run_state.params = {}
+    _run_state.tags = {}
+    _run_state.metrics = []
+    _run_state.metric_steps = {}
+
+
+def _buffer() -> Optional[Any]:
+    """Get this thread's run buffer.
+    
+    Returns:
+        The thread-local run state, or None if no run was started
+    """
+    if getattr(_run_state, "run_id", None) is None:
+        return None
+    return _run_state
+
+
+def _flush_run_data() -> None:
+    """Send this thread's buffered params, metrics and tags to its run.
+    
+    Data is sent with MlflowClient.log_batch against the explicit run ID,
+    split into requests that stay within MLflow's per-call limits.
+    """
+    state = _buffer()
+    if state is None:
+        return
+    
+    params = [Param(key, value) for key, value in state.params.items()]
+    tags = [RunTag(key, value) for key, value in state.tags.items()]
+    metrics = [
+        Metric(key, value, timestamp, step)
+        for key, value, timestamp, step in state.metrics
+    ]
+    state.params = {}
+    state.tags = {}
+    state.metrics = []
+    
+    if not (params or tags or metrics):
+        return
+    
+    client = MlflowClient()
+    while params or tags or metrics:
+        batch_params, params = params[:MAX_BATCH_PARAMS], params[MAX_BATCH_PARAMS:]
+        batch_tags, tags = tags[:MAX_BATCH_TAGS], tags[MAX_BATCH_TAGS:]
+        
+        metric_room = min(
+            MAX_BATCH_METRICS,
+            MAX_BATCH_ENTITIES - len(batch_params) - len(batch_tags)
+        )
+        batch_metrics, metrics = metrics[:metric_room], metrics[metric_room:]
+        
+        client.log_batch(
+            state.run_id,
+            metrics=batch_metrics,
+            params=batch_params,
+            tags=batch_tags
+        )
+
+
+def _flush_if_full(state: Any) -> None:
+    """Flush early once the buffer holds a full log_batch request.
+    
+    Args:
+        state: This thread's run buffer
+    """
+    if (
+        len(state.params) >= MAX_BATCH_PARAMS
+        or len(state.tags) >= MAX_BATCH_TAGS
+        or len(state.metrics) >= MAX_BATCH_METRICS
+    ):
+        _flush_run_data()
+
+
 def log_params(params: Dict[str, Any]) -> None:
-    """Log parameters to MLflow.
+    """Log parameters to MLflow (buffered until end_mlflow_run).
     
     Args:
         params: Dictionary of parameter names and values
@@ -88,13 +199,20 @@ def log_params(params: Dict[str, Any]) -> None:
         # Convert all values to strings (MLflow requirement)
         str_params = {k: str(v) for k, v in filtered_params.items()}
         
-        mlflow.log_params(str_params)
+        state = _buffer()
+        if state is None:
+            # No run started in this thread; log directly like before
+            mlflow.log_params(str_params)
+            return
+        
+        state.params.update(str_params)
+        _flush_if_full(state)
     except Exception as e:
         print(f"Warning: Failed to log MLflow params: {e}")
 
 
 def log_metrics(metrics: Dict[str, float]) -> None:
-    """Log metrics to MLflow.
+    """Log metrics to MLflow (buffered until end_mlflow_run).
     
     Args:
         metrics: Dictionary of metric names and numeric values
@@ -112,8 +230,22 @@ def log_metrics(metrics: Dict[str, float]) -> None:
                 except (ValueError, TypeError):
                     print(f"Warning: Skipping non-numeric metric {k}={v}")
         
-        if filtered_metrics:
+        if not filtered_metrics:
+            return
+        
+        state = _buffer()
+        if state is None:
+            # No run started in this thread; log directly like before
             mlflow.log_metrics(filtered_metrics)
+            return
+        
+        # Keep every value so repeated metrics log as a step series
+        timestamp = int(time.time() * 1000)
+        for k, v in filtered_metrics.items():
+            step = state.metric_steps.get(k, 0)
+            state.metric_steps[k] = step + 1
+            state.metrics.append((k, v, timestamp, step))
+        _flush_if_full(state)
     except Exception as e:
         print(f"Warning: Failed to log MLflow metrics: {e}")
 
@@ -154,7 +286,7 @@ def log_artifact_directory(dir_path: str) -> None:
 
 
 def set_tags(tags: Dict[str, str]) -> None:
-    """Set tags on the current MLflow run.
+    """Set tags on the current MLflow run (buffered until end_mlflow_run).
     
     Args:
         tags: Dictionary of tag names and values
@@ -165,6 +297,13 @@ def set_tags(tags: Dict[str, str]) -> None:
     try:
         # Filter out None values
         filtered_tags = {k: str(v) for k, v in tags.items() if v is not None}
-        mlflow.set_tags(filtered_tags)
+        state = _buffer()
+        if state is None:
+            # No run started in this thread; log directly like before
+            mlflow.set_tags(filtered_tags)
+            return
+        
+        state.tags.update(filtered_tags)
+        _flush_if_full(state)
     except Exception as e:
         print(f"Warning: Failed to set MLflow tags: {e}")
@@ -1,7 +1,8 @@
 """Pydantic models for MedLinker AI data contracts."""
 
-from typing import Optional, Dict
-from pydantic import BaseModel, Field, field_validator
+import sys
+from typing import Any, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from medlinker_ai.constants import (
     SourceType,
@@ -18,6 +19,8 @@ class FacilityDocInput(BaseModel):
     This represents messy, unstructured text from various sources
     that needs to be extracted and verified.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     facility_id: str
     facility_name: str
     country: str
@@ -29,6 +32,12 @@ class FacilityDocInput(BaseModel):
     timestamp: Optional[str] = None  # ISO 8601 format
     latitude: Optional[float] = None
     longitude: Optional[float] = None
+    
+    @field_validator("country", "region")
+    @classmethod
+    def intern_location(cls, v: str) -> str:
+        """Intern location strings, which repeat across many facilities."""
+        return sys.intern(v)
 
 
 class CapabilitySchemaV0(BaseModel):
@@ -37,6 +46,8 @@ class CapabilitySchemaV0(BaseModel):
     This schema represents the extracted and structured capabilities
     of a healthcare facility.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     services: list[str] = Field(default_factory=list)
     equipment: list[str] = Field(default_factory=list)
     staffing: list[str] = Field(default_factory=list)
@@ -50,16 +61,10 @@ class CapabilitySchemaV0(BaseModel):
         """Deduplicate and trim list items."""
         if not v:
             return []
-        # Trim whitespace and filter empty strings
-        trimmed = [item.strip() for item in v if item and item.strip()]
+        # Trim whitespace (once per item) and filter empty strings
+        trimmed = [item for item in (raw.strip() for raw in v if raw) if item]
         # Deduplicate while preserving order
-        seen = set()
-        result = []
-        for item in trimmed:
-            if item not in seen:
-                seen.add(item)
-                result.append(item)
-        return result
+        return list(dict.fromkeys(trimmed))
 
 
 class Citation(BaseModel):
@@ -68,6 +73,8 @@ class Citation(BaseModel):
     Citations provide traceability from extracted data back to
     the source text that supports it.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     source_id: str
     source_url: Optional[str] = None
     snippet: str = Field(..., min_length=1, max_length=500)
@@ -100,6 +107,8 @@ class FacilityAnalysisOutput(BaseModel):
     This represents the complete analysis result including extracted
     capabilities, verification status, and supporting evidence.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     facility_id: str
     facility_name: str = "Unknown Facility"  # Added for frontend display
     location: Optional[str] = None  # Added for frontend display (city, region, country)
@@ -114,13 +123,19 @@ class FacilityAnalysisOutput(BaseModel):
     citations: list[Citation] = Field(default_factory=list)
     trace_id: str
     
+    @field_validator("country", "region", "status")
+    @classmethod
+    def intern_repeated(cls, v: str) -> str:
+        """Intern location and status strings, which repeat across facilities."""
+        return sys.intern(v)
+    
     @field_validator("reasons")
     @classmethod
     def trim_reasons(cls, v: list[str]) -> list[str]:
         """Trim and filter empty reason strings."""
         if not v:
             return []
-        return [reason.strip() for reason in v if reason and reason.strip()]
+        return [reason for reason in (raw.strip() for raw in v if raw) if reason]
 
 
 
@@ -130,6 +145,8 @@ class RegionSummary(BaseModel):
     This represents aggregated facility data for a geographic region,
     including coverage analysis and desert scoring.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     country: str
     region: str
     total_facilities: int
@@ -140,3 +157,39 @@ class RegionSummary(BaseModel):
     desert_score: int = Field(ge=0, le=100)
     supporting_facility_ids: list[str] = Field(default_factory=list)
     trace_id: str
+
+
+def construct_facility_output(data: Dict[str, Any]) -> FacilityAnalysisOutput:
+    """Build a FacilityAnalysisOutput from trusted data without validation.
+    
+    Only use this for rows the pipeline wrote itself (e.g. outputs/facilities.jsonl);
+    untrusted input must go through normal validation.
+    
+    Args:
+        data: Dumped FacilityAnalysisOutput fields (modified in place)
+        
+    Returns:
+        FacilityAnalysisOutput with nested models constructed
+    """
+    data["extracted_capabilities"] = CapabilitySchemaV0.model_construct(
+        **data["extracted_capabilities"]
+    )
+    data["citations"] = [Citation.model_construct(**c) for c in data.get("citations", ())]
+    for key in ("country", "region", "status"):
+        if key in data:
+            data[key] = sys.intern(data[key])
+    return FacilityAnalysisOutput.model_construct(**data)
+
+
+def construct_region_summary(data: Dict[str, Any]) -> RegionSummary:
+    """Build a RegionSummary from trusted data without validation.
+    
+    Args:
+        data: Dumped RegionSummary fields (modified in place)
+        
+    Returns:
+        RegionSummary instance
+    """
+    data["country"] = sys.intern(data["country"])
+    data["region"] = sys.intern(data["region"])
+    return RegionSummary.model_construct(**data)
@@ -1,6 +1,6 @@
 """Normalization and synonym mapping for capability terms."""
 
-import re
+from functools import lru_cache
 
 
 # Synonym mappings (conservative)
@@ -56,16 +56,9 @@ def normalize_term(text: str) -> str:
     if not text:
         return ""
     
-    # Lowercase
-    normalized = text.lower()
-    
-    # Strip whitespace
-    normalized = normalized.strip()
-    
-    # Collapse multiple spaces
-    normalized = re.sub(r'\s+', ' ', normalized)
-    
-    return normalized
+    # Lowercase, strip and collapse whitespace runs (str.split() splits on
+    # the same characters as \s, without a trip through the regex engine)
+    return " ".join(text.lower().split())
 
 
 def map_synonym(term: str) -> str:
@@ -81,13 +74,19 @@ def map_synonym(term: str) -> str:
     return SYNONYM_MAP.get(normalized, normalized)
 
 
+@lru_cache(maxsize=8192)
 def normalize_and_map(term: str) -> str:
     """Normalize and map a term in one step.
     
+    Results are memoized since the same raw capability strings repeat
+    across facilities during aggregation.
+    
     Args:
         term: Raw capability term
         
     Returns:
         Canonical normalized term
     """
-    return map_synonym(normalize_term(term))
+    # map_synonym would normalize the term a second time
+    normalized = normalize_term(term)
+    return SYNONYM_MAP.get(normalized, normalized)
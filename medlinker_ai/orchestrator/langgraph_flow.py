@@ -5,7 +5,8 @@ Falls back to direct function calls if LangGraph is not available.
 """
 
 import os
-from typing import TypedDict, List, Optional, Dict, Any
+from functools import lru_cache
+from typing import TypedDict, List, Optional, Dict, Any, Tuple
 
 from medlinker_ai.models import FacilityAnalysisOutput, RegionSummary
 
@@ -40,16 +41,17 @@ if LANGGRAPH_AVAILABLE:
         citations: Optional[List[dict]]
         trace_id: Optional[str]
         llm_provider: Optional[str]
+        search_texts: Optional[Tuple[List[str], List[str]]]
     
     
-    def answer_node(state: AskFlowState) -> AskFlowState:
+    def answer_node(state: AskFlowState) -> dict:
         """Answer node that calls existing answer_planner_question.
         
         Args:
             state: Current state
             
         Returns:
-            Updated state with answer
+            State update with answer
         """
         from medlinker_ai.qa import answer_planner_question
         
@@ -57,20 +59,23 @@ if LANGGRAPH_AVAILABLE:
             state["question"],
             state["facilities"],
             state["regions"],
-            llm_provider=state.get("llm_provider")
+            llm_provider=state.get("llm_provider"),
+            search_texts=state.get("search_texts")
         )
         
         return {
-            **state,
             "answer": result["answer"],
             "citations": result["citations"],
             "trace_id": result["trace_id"]
         }
     
     
+    @lru_cache(maxsize=None)
     def build_ask_graph() -> StateGraph:
         """Build LangGraph for ask flow.
         
+        The graph is static, so it is compiled once and reused.
+        
         Returns:
             Compiled StateGraph
         """
@@ -92,7 +97,8 @@ def run_ask_flow(
     question: str,
     facilities: List[FacilityAnalysisOutput],
     regions: List[RegionSummary],
-    llm_provider: Optional[str] = None
+    llm_provider: Optional[str] = None,
+    search_texts: Optional[Tuple[List[str], List[str]]] = None
 ) -> Dict[str, Any]:
     """Run ask flow with optional LangGraph orchestration.
     
@@ -101,6 +107,7 @@ def run_ask_flow(
         facilities: List of facility outputs
         regions: List of region summaries
         llm_provider: Optional LLM provider
+        search_texts: Optional prebuilt retrieval texts (see qa.build_search_texts)
         
     Returns:
         Dictionary with answer, citations, and trace_id
@@ -116,7 +123,8 @@ def run_ask_flow(
             "answer": None,
             "citations": None,
             "trace_id": None,
-            "llm_provider": llm_provider
+            "llm_provider": llm_provider,
+            "search_texts": search_texts
         }
         
         final_state = graph.invoke(initial_state)
@@ -134,5 +142,6 @@ def run_ask_flow(
             question,
             facilities,
             regions,
-            llm_provider=llm_provider
+            llm_provider=llm_provider,
+            search_texts=search_texts
         )
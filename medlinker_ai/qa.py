@@ -1,9 +1,12 @@
 """Planner Q&A with grounded answers and citations."""
 
+import heapq
 import re
 import json
 import os
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
+
+from pydantic import TypeAdapter
 
 from medlinker_ai.models import FacilityAnalysisOutput, RegionSummary, Citation
 from medlinker_ai.utils import generate_trace_id
@@ -19,6 +22,16 @@ from medlinker_ai.mlflow_utils import (
 )
 
 
+# Serializes a whole citations list in one pydantic-core call
+_citation_list_adapter = TypeAdapter(List[Citation])
+
+# Patterns used on every question/answer, compiled once
+_WORD_RE = re.compile(r'\b\w+\b')
+_TOP_N_RE = re.compile(r'top\s+(\d+)')
+_NUMERIC_CLAIM_RE = re.compile(r'\d+\s+(region|facilit|score)', re.IGNORECASE)
+_REGION_CLAIM_RE = re.compile(r'(region|country):\s*\w+', re.IGNORECASE)
+
+
 def keyword_match_score(query: str, text: str) -> int:
     """Compute simple keyword match score.
     
@@ -29,12 +42,16 @@ def keyword_match_score(query: str, text: str) -> int:
     Returns:
         Number of query keywords found in text
     """
-    query_lower = query.lower()
-    text_lower = text.lower()
-    
-    # Extract keywords (words 3+ chars)
-    keywords = [w for w in re.findall(r'\b\w+\b', query_lower) if len(w) >= 3]
-    
+    return _count_keyword_hits(_extract_query_keywords(query), text.lower())
+
+
+def _extract_query_keywords(query: str) -> List[str]:
+    """Extract lowercased query keywords (words of 3+ chars)."""
+    return [w for w in _WORD_RE.findall(query.lower()) if len(w) >= 3]
+
+
+def _count_keyword_hits(keywords: List[str], text_lower: str) -> int:
+    """Count keywords that occur in already lowercased text."""
     score = 0
     for keyword in keywords:
         if keyword in text_lower:
@@ -85,11 +102,34 @@ def build_region_search_text(region: RegionSummary) -> str:
     return " ".join(parts)
 
 
+def build_search_texts(
+    facilities: List[FacilityAnalysisOutput],
+    regions: List[RegionSummary]
+) -> Tuple[List[str], List[str]]:
+    """Build lowercased keyword-retrieval texts for facilities and regions.
+    
+    Callers answering many questions over the same loaded data (the API)
+    build these once per data load and pass them to answer_planner_question.
+    
+    Args:
+        facilities: List of facility outputs
+        regions: List of region summaries
+        
+    Returns:
+        Tuple of (facility texts, region texts), in input order
+    """
+    return (
+        [build_facility_search_text(f).lower() for f in facilities],
+        [build_region_search_text(r).lower() for r in regions]
+    )
+
+
 def retrieve_context(
     question: str,
     facilities: List[FacilityAnalysisOutput],
     regions: List[RegionSummary],
-    k: int = 8
+    k: int = 8,
+    search_texts: Optional[Tuple[List[str], List[str]]] = None
 ) -> Dict[str, List]:
     """Retrieve relevant facilities and regions for question.
     
@@ -100,6 +140,8 @@ def retrieve_context(
         facilities: List of facility outputs
         regions: List of region summaries
         k: Number of items to retrieve
+        search_texts: Optional prebuilt texts from build_search_texts for
+            these exact lists; built on the fly when omitted
         
     Returns:
         Dictionary with selected_facilities and selected_regions
@@ -128,26 +170,17 @@ def retrieve_context(
         pass
     
     # Fallback: keyword-based retrieval (current behavior)
-    # Score facilities
-    facility_scores = []
-    for facility in facilities:
-        search_text = build_facility_search_text(facility)
-        score = keyword_match_score(question, search_text)
-        facility_scores.append((score, facility))
-    
-    # Score regions
-    region_scores = []
-    for region in regions:
-        search_text = build_region_search_text(region)
-        score = keyword_match_score(question, search_text)
-        region_scores.append((score, region))
-    
-    # Sort and select top k
-    facility_scores.sort(key=lambda x: x[0], reverse=True)
-    region_scores.sort(key=lambda x: x[0], reverse=True)
-    
-    selected_facilities = [f for _, f in facility_scores[:k]]
-    selected_regions = [r for _, r in region_scores[:k]]
+    # Extract the question's keywords once for all items
+    keywords = _extract_query_keywords(question)
+    
+    facility_texts, region_texts = search_texts or build_search_texts(facilities, regions)
+    
+    # Select the top k by score (ties keep input order, as a stable sort would)
+    def score(pair: Tuple[Any, str]) -> int:
+        return _count_keyword_hits(keywords, pair[1])
+    
+    selected_facilities = [f for f, _ in heapq.nlargest(k, zip(facilities, facility_texts), key=score)]
+    selected_regions = [r for r, _ in heapq.nlargest(k, zip(regions, region_texts), key=score)]
     
     return {
         "selected_facilities": selected_facilities,
@@ -207,7 +240,7 @@ def generate_fallback_answer(
     if intent == "desert_ranking":
         # Ranking query - show top N regions by desert score
         # Extract number if present (e.g., "top 3", "top 5")
-        match = re.search(r'top\s+(\d+)', question.lower())
+        match = _TOP_N_RE.search(question.lower())
         limit = int(match.group(1)) if match else 5
         
         # Sort all regions by desert score (highest first)
@@ -412,7 +445,7 @@ def generate_fallback_answer(
         # Capability search query
         # Extract capability keywords
         capability_keywords = []
-        for word in re.findall(r'\b\w+\b', question.lower()):
+        for word in _WORD_RE.findall(question.lower()):
             if len(word) >= 4 and word not in ["where", "which", "find", "have", "with", "that"]:
                 capability_keywords.append(word)
         
@@ -478,7 +511,8 @@ def answer_planner_question(
     question: str,
     facilities: List[FacilityAnalysisOutput],
     regions: List[RegionSummary],
-    llm_provider: Optional[str] = None
+    llm_provider: Optional[str] = None,
+    search_texts: Optional[Tuple[List[str], List[str]]] = None
 ) -> Dict[str, any]:
     """Answer planner question with grounded response and citations.
     
@@ -487,6 +521,7 @@ def answer_planner_question(
         facilities: List of facility outputs
         regions: List of region summaries
         llm_provider: Optional LLM provider override
+        search_texts: Optional prebuilt retrieval texts (see build_search_texts)
         
     Returns:
         Dictionary with answer, citations, and trace_id
@@ -506,7 +541,7 @@ def answer_planner_question(
     start_trace(trace_id)
     
     # Retrieve relevant context
-    context = retrieve_context(question, facilities, regions, k=8)
+    context = retrieve_context(question, facilities, regions, k=8, search_texts=search_texts)
     selected_facilities = context["selected_facilities"]
     selected_regions = context["selected_regions"]
     
@@ -529,9 +564,10 @@ def answer_planner_question(
     if not citations:
         # Check if answer contains factual claims that need citations
         # Only reject if answer makes specific numeric or regional claims
-        has_specific_numbers = bool(re.search(r'\d+\s+(region|facilit|score)', answer, re.IGNORECASE))
-        has_desert_score = 'desert' in answer.lower() and 'score' in answer.lower()
-        has_specific_region = bool(re.search(r'(region|country):\s*\w+', answer, re.IGNORECASE))
+        has_specific_numbers = bool(_NUMERIC_CLAIM_RE.search(answer))
+        answer_lower = answer.lower()
+        has_desert_score = 'desert' in answer_lower and 'score' in answer_lower
+        has_specific_region = bool(_REGION_CLAIM_RE.search(answer))
         
         needs_citations = has_specific_numbers or has_desert_score or has_specific_region
         
@@ -579,6 +615,6 @@ def answer_planner_question(
     
     return {
         "answer": answer,
-        "citations": [c.model_dump() for c in citations],
+        "citations": _citation_list_adapter.dump_python(citations),
         "trace_id": trace_id
     }
@@ -1,11 +1,13 @@
 """Tracing and auditability for MedLinker AI pipeline."""
 
 import os
-import json
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Literal, Optional, Any
+from typing import Dict, Iterator, List, Literal, Optional, Any
 from pathlib import Path
 
+import orjson
 from pydantic import BaseModel
 
 
@@ -30,12 +32,25 @@ class TraceRun(BaseModel):
 
 # Global trace storage
 _active_traces: Dict[str, List[TraceSpan]] = {}
+# MLflow tags/params and metric history buffered per trace, flushed in end_trace
+_pending_mlflow: Dict[str, Dict[str, Any]] = {}
+# MLflow run each trace logs into, captured in start_trace
+_trace_runs: Dict[str, str] = {}
 _mlflow_available = False
 _mlflow_client = None
 
+# When set, end_trace collects encoded trace lines here instead of writing
+# traces.jsonl (see collect_trace_lines)
+_trace_line_buffer: Optional[List[bytes]] = None
+
+# MLflow log_batch limit on metrics per request
+_MAX_BATCH_METRICS = 1000
+
 # Check if MLflow is available
 try:
     import mlflow
+    from mlflow.entities import Metric, Param, RunTag
+    from mlflow.tracking import MlflowClient
     if os.getenv("MLFLOW_TRACKING_URI"):
         _mlflow_available = True
         mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI"))
@@ -61,6 +76,15 @@ def start_trace(trace_id: str) -> str:
         except Exception:
             # If MLflow fails, continue with local logging
             pass
+        
+        # Remember the run this trace logs into (an enclosing run if ours
+        # could not be started)
+        try:
+            active_run = mlflow.active_run()
+            if active_run is not None:
+                _trace_runs[trace_id] = active_run.info.run_id
+        except Exception:
+            pass
     
     return trace_id
 
@@ -91,32 +115,113 @@ def log_span(
     )
     
     # Store locally
-    if trace_id not in _active_traces:
-        _active_traces[trace_id] = []
-    _active_traces[trace_id].append(span)
+    _active_traces.setdefault(trace_id, []).append(span)
     
-    # Log to MLflow if available
+    # Buffer for MLflow; written in one batch when the trace ends
     if _mlflow_available:
+        pending = _pending_mlflow.setdefault(
+            trace_id, {"tags": {}, "params": {}, "metrics": [], "steps": {}}
+        )
+        
+        # Log as tags and metrics
+        pending["tags"][f"step_{step_name}"] = "completed"
+        
+        # Log small params (MLflow params are immutable, so the first value wins)
+        for key, value in inputs_summary.items():
+            if isinstance(value, (str, int, float, bool)):
+                pending["params"].setdefault(f"{step_name}_input_{key}", str(value)[:250])
+        
+        # Log metrics (counts only); repeated steps keep every value as a series
+        timestamp = int(time.time() * 1000)
+        metrics = {
+            f"{step_name}_{key}": value
+            for key, value in outputs_summary.items()
+            if isinstance(value, (int, float))
+        }
+        metrics[f"{step_name}_evidence_refs"] = evidence_refs
+        
+        for key, value in metrics.items():
+            step = pending["steps"].get(key, 0)
+            pending["steps"][key] = step + 1
+            pending["metrics"].append(Metric(key, float(value), timestamp, step))
+
+
+def _flush_mlflow(trace_id: str) -> None:
+    """Write buffered MLflow tags, params, and metrics for a trace.
+    
+    Tags, params and metrics are sent separately, so a failure in one does
+    not drop the others.
+    
+    Args:
+        trace_id: Trace identifier
+    """
+    pending = _pending_mlflow.pop(trace_id, None)
+    run_id = _trace_runs.pop(trace_id, None)
+    if not pending or run_id is None:
+        return
+    
+    client = MlflowClient()
+    
+    try:
+        if pending["tags"]:
+            client.log_batch(
+                run_id, tags=[RunTag(k, v) for k, v in pending["tags"].items()]
+            )
+    except Exception:
+        # If MLflow fails, continue with local logging
+        pass
+    
+    try:
+        if pending["params"]:
+            client.log_batch(
+                run_id, params=[Param(k, v) for k, v in pending["params"].items()]
+            )
+    except Exception:
+        pass
+    
+    metrics = pending["metrics"]
+    for start in range(0, len(metrics), _MAX_BATCH_METRICS):
         try:
-            # Log as tags and metrics
-            mlflow.set_tag(f"step_{step_name}", "completed")
-            
-            # Log small params
-            for key, value in inputs_summary.items():
-                if isinstance(value, (str, int, float, bool)):
-                    mlflow.log_param(f"{step_name}_input_{key}", str(value)[:250])
-            
-            # Log metrics (counts only)
-            for key, value in outputs_summary.items():
-                if isinstance(value, (int, float)):
-                    mlflow.log_metric(f"{step_name}_{key}", value)
-            
-            mlflow.log_metric(f"{step_name}_evidence_refs", evidence_refs)
+            client.log_batch(run_id, metrics=metrics[start:start + _MAX_BATCH_METRICS])
         except Exception:
-            # If MLflow fails, continue with local logging
             pass
 
 
+@contextmanager
+def collect_trace_lines() -> Iterator[List[bytes]]:
+    """Collect traces ended inside the block instead of writing them.
+    
+    Used by worker processes, which return the lines so that only the parent
+    process appends to traces.jsonl.
+    
+    Yields:
+        List that receives one encoded JSONL line per ended trace
+    """
+    global _trace_line_buffer
+    previous = _trace_line_buffer
+    _trace_line_buffer = lines = []
+    try:
+        yield lines
+    finally:
+        _trace_line_buffer = previous
+
+
+def append_trace_lines(lines: List[bytes]) -> None:
+    """Append encoded trace lines to the local traces.jsonl file.
+    
+    Args:
+        lines: JSONL lines (with trailing newlines) from end_trace
+    """
+    if not lines:
+        return
+    
+    output_dir = Path("./outputs")
+    output_dir.mkdir(exist_ok=True)
+    
+    with open(output_dir / "traces.jsonl", 'ab') as f:
+        f.write(b"".join(lines))
+
+
 def end_trace(trace_id: str) -> None:
     """End a trace and persist to local storage.
     
@@ -126,22 +231,21 @@ def end_trace(trace_id: str) -> None:
     if trace_id in _active_traces:
         spans = _active_traces[trace_id]
         
-        # Write to local JSON file
-        output_dir = Path("./outputs")
-        output_dir.mkdir(exist_ok=True)
-        
-        trace_file = output_dir / "traces.jsonl"
-        
+        # Write to local JSON file (or hand the line to a collecting caller)
         trace_run = TraceRun(trace_id=trace_id, spans=spans)
+        line = orjson.dumps(trace_run.model_dump()) + b"\n"
         
-        with open(trace_file, 'a') as f:
-            f.write(json.dumps(trace_run.model_dump()) + "\n")
+        if _trace_line_buffer is not None:
+            _trace_line_buffer.append(line)
+        else:
+            append_trace_lines([line])
         
         # Clean up
         del _active_traces[trace_id]
     
-    # End MLflow run if active
+    # Flush buffered data and end MLflow run if active
     if _mlflow_available:
+        _flush_mlflow(trace_id)
         try:
             mlflow.end_run()
         except Exception:
@@ -164,10 +268,10 @@ def get_trace(trace_id: str) -> Optional[TraceRun]:
     # Check local file
     trace_file = Path("./outputs/traces.jsonl")
     if trace_file.exists():
-        with open(trace_file, 'r') as f:
+        with open(trace_file, 'rb') as f:
             for line in f:
                 if line.strip():
-                    data = json.loads(line)
+                    data = orjson.loads(line)
                     if data["trace_id"] == trace_id:
                         return TraceRun(**data)
     
@@ -197,11 +301,11 @@ def list_recent_traces(limit: int = 10) -> List[str]:
     trace_file = Path("./outputs/traces.jsonl")
     
     if trace_file.exists():
-        with open(trace_file, 'r') as f:
+        with open(trace_file, 'rb') as f:
             lines = f.readlines()
             for line in reversed(lines[-limit:]):
                 if line.strip():
-                    data = json.loads(line)
+                    data = orjson.loads(line)
                     trace_ids.append(data["trace_id"])
     
     return trace_ids
@@ -1,6 +1,10 @@
 """Utility functions for MedLinker AI."""
 
+import gzip
+import io
 import uuid
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
 
 
 def generate_trace_id() -> str:
@@ -10,3 +14,69 @@ def generate_trace_id() -> str:
         A UUID4 string for tracing.
     """
     return str(uuid.uuid4())
+
+
+def open_data_file(path: Union[str, Path], mode: str = "rb") -> BinaryIO:
+    """Open a data file in binary mode, (de)compressing based on its suffix.
+    
+    Files ending in ".gz" use gzip and files ending in ".zst" use zstandard
+    (optional dependency); anything else is opened as-is.
+    
+    Args:
+        path: File path
+        mode: "rb" or "wb"
+        
+    Returns:
+        Binary file object (usable as a context manager)
+        
+    Raises:
+        ValueError: If mode is not "rb" or "wb"
+        ImportError: If a .zst file is used without zstandard installed
+    """
+    if mode not in ("rb", "wb"):
+        raise ValueError(f"Unsupported mode: {mode}. Use 'rb' or 'wb'")
+    
+    path = Path(path)
+    
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)
+    
+    if path.suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard package required for .zst files. "
+                "Install with: pip install zstandard"
+            )
+        
+        # Buffered wrappers give the streams the full file API (readline,
+        # iteration, writelines) that the zstandard objects lack
+        if mode == "rb":
+            reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+            return io.BufferedReader(reader)
+        writer = zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+        return io.BufferedWriter(writer)
+    
+    return open(path, mode)
+
+
+def resolve_data_file(path: Union[str, Path]) -> Optional[Path]:
+    """Find the newest existing variant of a data file.
+    
+    Checks the plain path and its ".gz"/".zst" compressed variants.
+    
+    Args:
+        path: Uncompressed file path (e.g. "outputs/facilities.jsonl")
+        
+    Returns:
+        Path of the most recently modified variant, or None if none exist
+    """
+    path = Path(path)
+    candidates = [
+        p for p in (path, path.with_name(path.name + ".gz"), path.with_name(path.name + ".zst"))
+        if p.exists()
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime_ns)
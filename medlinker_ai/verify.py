@@ -3,6 +3,14 @@
 import re
 from typing import Optional
 
+from medlinker_ai.constants import (
+    STATUS_VERIFIED,
+    STATUS_INCOMPLETE,
+    STATUS_SUSPICIOUS,
+    CONFIDENCE_LOW,
+    CONFIDENCE_MEDIUM,
+    CONFIDENCE_HIGH,
+)
 from medlinker_ai.models import (
     FacilityDocInput,
     FacilityAnalysisOutput,
@@ -306,20 +314,20 @@ def calculate_confidence(
         Confidence level: LOW, MEDIUM, or HIGH
     """
     # Start at HIGH
-    confidence = "HIGH"
+    confidence = CONFIDENCE_HIGH
     
     # Adjust based on status
-    if status == "INCOMPLETE":
-        confidence = "MEDIUM"
-    elif status == "SUSPICIOUS":
-        confidence = "LOW"
+    if status == STATUS_INCOMPLETE:
+        confidence = CONFIDENCE_MEDIUM
+    elif status == STATUS_SUSPICIOUS:
+        confidence = CONFIDENCE_LOW
     
     # Reduce if insufficient citations
     if citation_count < 2:
-        if confidence == "HIGH":
-            confidence = "MEDIUM"
-        elif confidence == "MEDIUM":
-            confidence = "LOW"
+        if confidence == CONFIDENCE_HIGH:
+            confidence = CONFIDENCE_MEDIUM
+        elif confidence == CONFIDENCE_MEDIUM:
+            confidence = CONFIDENCE_LOW
     
     return confidence
 
@@ -355,13 +363,13 @@ def verify_facility(
     
     # Determine status
     if len(suspicious_reasons) > 0:
-        status = "SUSPICIOUS"
+        status = STATUS_SUSPICIOUS
         reasons = suspicious_reasons + incomplete_reasons
     elif len(incomplete_reasons) > 0:
-        status = "INCOMPLETE"
+        status = STATUS_INCOMPLETE
         reasons = incomplete_reasons
     else:
-        status = "VERIFIED"
+        status = STATUS_VERIFIED
         reasons = []
     
     # Merge all citations
@@ -14,8 +14,11 @@ from medlinker_ai.models import (
 from medlinker_ai.aggregate import (
     group_by_region,
     compute_coverage,
+    compute_coverage_and_missing,
     compute_missing_critical,
     compute_desert_score,
+    compute_desert_score_from_counts,
+    get_supporting_facilities,
     compute_region_summary,
     aggregate_regions
 )
@@ -127,6 +130,37 @@ def test_compute_missing_critical():
     assert "staffing:doctor" not in missing
 
 
+def test_compute_coverage_and_missing_matches_separate_passes():
+    """Test that the fused pass matches coverage + missing computed separately."""
+    facilities = [
+        create_test_facility(
+            "GH-ACC-001",
+            services=["Cesarean", "ER"],
+            equipment=["Xray"],
+            staffing=["Doctors"]
+        ),
+        create_test_facility(
+            "GH-ACC-002",
+            services=["Laboratory"],
+            equipment=[],
+            staffing=["Physician"]
+        ),
+    ]
+    
+    coverage, missing, missing_counts = compute_coverage_and_missing(facilities)
+    
+    assert coverage == compute_coverage(facilities)
+    assert missing == compute_missing_critical(coverage)
+    assert missing_counts == {"service": 2, "equipment": 1, "staffing": 1}
+    assert compute_desert_score_from_counts(missing_counts) == compute_desert_score(missing)
+    assert missing == [
+        "service:ultrasound",
+        "service:x-ray",
+        "equipment:ultrasound",
+        "staffing:midwife"
+    ]
+
+
 
 def test_compute_desert_score():
     """Test desert score computation."""
@@ -162,6 +196,20 @@ def test_compute_desert_score():
     assert score <= 100
 
 
+def test_get_supporting_facilities_prioritizes_verified():
+    """Test supporting facilities list VERIFIED first, then fills in order."""
+    facilities = [
+        create_test_facility("GH-001", [], [], [], status="INCOMPLETE"),
+        create_test_facility("GH-002", [], [], [], status="VERIFIED"),
+        create_test_facility("GH-003", [], [], [], status="SUSPICIOUS"),
+        create_test_facility("GH-004", [], [], [], status="VERIFIED"),
+    ]
+    
+    assert get_supporting_facilities(facilities, max_count=3) == ["GH-002", "GH-004", "GH-001"]
+    assert get_supporting_facilities(facilities, max_count=2) == ["GH-002", "GH-004"]
+    assert get_supporting_facilities(facilities) == ["GH-002", "GH-004", "GH-001", "GH-003"]
+
+
 def test_compute_region_summary():
     """Test region summary computation."""
     facilities = [
@@ -212,6 +260,26 @@ def test_aggregate_regions():
         assert summaries[i].desert_score >= summaries[i+1].desert_score
 
 
+def test_aggregate_regions_parallel_matches_serial(monkeypatch):
+    """Test that process-parallel aggregation matches the in-process path."""
+    import medlinker_ai.aggregate as aggregate_module
+    
+    facilities = []
+    for i in range(6):
+        facility = create_test_facility(f"GH-{i:03d}", ["C-Section"], ["X-ray"], ["Doctor"])
+        facilities.append(facility.model_copy(update={"country": "GH", "region": f"R{i % 3}"}))
+    
+    serial = aggregate_regions(facilities)
+    monkeypatch.setattr(aggregate_module, "PARALLEL_AGGREGATION_MIN_REGIONS", 1)
+    parallel = aggregate_regions(facilities)
+    
+    def strip_trace(summaries):
+        return [s.model_dump(exclude={"trace_id"}) for s in summaries]
+    
+    assert len(parallel) == 3
+    assert strip_trace(parallel) == strip_trace(serial)
+
+
 def test_region_summary_validates():
     """Test that RegionSummary validates correctly."""
     summary = RegionSummary(
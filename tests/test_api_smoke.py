@@ -93,6 +93,17 @@ def test_health_check(client):
     assert data["status"] == "healthy"
 
 
+def test_invalid_log_level_falls_back_to_info(monkeypatch):
+    """Test an unknown MEDLINKER_LOG_LEVEL does not break startup."""
+    from medlinker_ai.api import _resolve_log_level
+    
+    monkeypatch.setenv("MEDLINKER_LOG_LEVEL", "verbose")
+    assert _resolve_log_level() == "INFO"
+    
+    monkeypatch.setenv("MEDLINKER_LOG_LEVEL", "warning")
+    assert _resolve_log_level() == "WARNING"
+
+
 def test_get_facilities(client, setup_test_data):
     """Test GET /facilities returns facility list."""
     response = client.get("/facilities")
@@ -130,6 +141,107 @@ def test_get_facilities_not_found(client):
             backup_file.rename(facilities_file)
 
 
+def test_load_facilities_cached_until_file_changes(setup_test_data):
+    """Test facilities are reused from cache and reloaded after a rewrite."""
+    from medlinker_ai.api import load_facilities
+    
+    first = load_facilities()
+    assert load_facilities() is first
+    
+    # Rewrite the file with one fewer facility
+    facilities_file = Path("./outputs/facilities.jsonl")
+    lines = facilities_file.read_text().splitlines(keepends=True)
+    facilities_file.write_text("".join(lines[:-1]))
+    
+    reloaded = load_facilities()
+    assert reloaded is not first
+    assert len(reloaded) == len(first) - 1
+
+
+def test_admin_invalidate_clears_cache(client, setup_test_data):
+    """Test POST /admin/invalidate forces facilities to be re-parsed."""
+    from medlinker_ai.api import load_facilities
+    
+    first = load_facilities()
+    
+    response = client.post("/admin/invalidate")
+    assert response.status_code == 200
+    assert response.json() == {"status": "invalidated"}
+    
+    assert load_facilities() is not first
+
+
+def test_get_facilities_reuses_encoded_body(client, setup_test_data):
+    """Test /facilities serves the same body from the encoded cache."""
+    first = client.get("/facilities")
+    second = client.get("/facilities")
+    
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert second.content == first.content
+
+
+def test_get_facilities_gzip_encoding(client, setup_test_data):
+    """Test /facilities is gzip-encoded only when the client accepts it."""
+    compressed = client.get("/facilities", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/facilities", headers={"Accept-Encoding": "identity"})
+    
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert compressed.json() == plain.json()
+
+
+def test_get_facilities_gzip_refused_with_zero_quality(client, setup_test_data):
+    """Test gzip;q=0 in Accept-Encoding is treated as a refusal."""
+    from medlinker_ai.api import _accepts_gzip
+    
+    response = client.get("/facilities", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    
+    assert "content-encoding" not in response.headers
+    assert isinstance(response.json(), list)
+    assert _accepts_gzip("deflate, gzip;q=0.5")
+    assert _accepts_gzip("*")
+    assert not _accepts_gzip("*, gzip;q=0")
+    assert not _accepts_gzip("br")
+
+
+def test_load_facilities_from_gzip(setup_test_data):
+    """Test facilities are read from a newer gzip-compressed JSONL file."""
+    import gzip
+    from medlinker_ai.api import load_facilities
+    
+    facilities_file = Path("./outputs/facilities.jsonl")
+    gz_file = Path("./outputs/facilities.jsonl.gz")
+    lines = facilities_file.read_bytes().splitlines(keepends=True)
+    
+    try:
+        with gzip.open(gz_file, "wb") as f:
+            f.writelines(lines[:1])
+        os.utime(gz_file, ns=(0, facilities_file.stat().st_mtime_ns + 1))
+        
+        facilities = load_facilities()
+        assert len(facilities) == 1
+    finally:
+        gz_file.unlink(missing_ok=True)
+
+
+def test_load_facilities_validated_matches_constructed(setup_test_data, monkeypatch):
+    """Test MEDLINKER_VALIDATE_DISK=1 loads the same data with validation."""
+    from medlinker_ai.api import load_facilities, load_regions, clear_data_cache
+    
+    constructed = load_facilities()
+    constructed_regions = load_regions()
+    
+    monkeypatch.setenv("MEDLINKER_VALIDATE_DISK", "1")
+    clear_data_cache()
+    validated = load_facilities()
+    validated_regions = load_regions()
+    clear_data_cache()
+    
+    assert validated == constructed
+    assert validated_regions == constructed_regions
+
+
 def test_get_regions(client, setup_test_data):
     """Test GET /regions returns region list."""
     response = client.get("/regions")
@@ -192,6 +304,26 @@ def test_post_ask(client, setup_test_data):
         assert "field" in citation
 
 
+def test_post_ask_survives_failing_feature_probes(client, setup_test_data, monkeypatch):
+    """Test /ask falls back to basic QA when RAG/orchestrator probes raise."""
+    import medlinker_ai.api as api_module
+    
+    def broken_probe():
+        raise RuntimeError("index file missing")
+    
+    monkeypatch.setattr(api_module, "RAG_MODULE_AVAILABLE", True)
+    monkeypatch.setattr(api_module, "is_rag_available", broken_probe, raising=False)
+    monkeypatch.setattr(api_module, "ORCHESTRATOR_MODULE_AVAILABLE", True)
+    monkeypatch.setattr(api_module, "is_orchestrator_enabled", broken_probe, raising=False)
+    
+    response = client.post(
+        "/ask",
+        json={"question": "Which regions are medical deserts?"}
+    )
+    assert response.status_code == 200
+    assert len(response.json()["answer"]) > 0
+
+
 def test_post_ask_empty_question(client, setup_test_data):
     """Test POST /ask rejects empty question."""
     response = client.post(
@@ -211,6 +343,45 @@ def test_post_ask_whitespace_question(client, setup_test_data):
     assert response.status_code == 400
 
 
+def test_demo_process_facility(client):
+    """Test POST /demo/process_facility runs the full pipeline."""
+    response = client.post(
+        "/demo/process_facility",
+        json={
+            "facility_id": "DEMO001",
+            "facility_name": "Demo Hospital",
+            "region": "Demo Region",
+            "country": "Demo Country",
+            "source_id": "demo_source",
+            "source_type": "dataset_row",
+            "source_text": "Provides emergency care and surgery. Staff: doctors, nurses."
+        }
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    
+    data = response.json()
+    assert data["facility_analysis"]["facility_id"] == "DEMO001"
+    assert data["region_summary"]["region"] == "Demo Region"
+    assert data["sample_qa"]["question"]
+    
+    trace = client.get(f"/trace/{data['trace_id']}").json()
+    assert [s["step_name"] for s in trace["spans"]] == ["extract", "verify", "aggregate", "answer"]
+
+
+def test_demo_process_facility_invalid_input(client):
+    """Test POST /demo/process_facility rejects invalid input."""
+    response = client.post("/demo/process_facility", json={"facility_id": "DEMO001"})
+    assert response.status_code == 400
+    
+    response = client.post(
+        "/demo/process_facility",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 400
+
+
 def test_get_trace(client, setup_test_data):
     """Test GET /trace/{trace_id} returns trace details."""
     # First, get a trace_id from facilities
@@ -415,6 +586,20 @@ def test_trace_with_url_encoded_id(client, setup_test_data):
     assert response_encoded.json()["trace_id"] == response_normal.json()["trace_id"]
 
 
+def test_trace_malformed_id_skips_lookup(client, monkeypatch):
+    """Test /trace with a non-UUID trace_id returns 404 without a store lookup."""
+    import medlinker_ai.api as api
+    
+    def fail_lookup(trace_id):
+        raise AssertionError("get_trace should not be called")
+    
+    monkeypatch.setattr(api, "get_trace", fail_lookup)
+    
+    response = client.get("/trace/invalid-trace-id-12345")
+    assert response.status_code == 404
+    assert "Trace not found" in response.json()["detail"]
+
+
 def test_trace_not_found_message(client):
     """Test /trace with invalid trace_id returns helpful message."""
     response = client.get("/trace/invalid-trace-id-12345")
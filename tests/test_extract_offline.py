@@ -9,7 +9,8 @@ import pytest
 os.environ["LLM_PROVIDER"] = "none"
 
 from medlinker_ai.models import FacilityDocInput, CapabilitySchemaV0, Citation
-from medlinker_ai.extract import extract_capabilities
+from medlinker_ai.extract import extract_capabilities, extract_capabilities_batch
+from medlinker_ai.llm.fallback import FallbackClient
 
 
 def load_example(filename: str) -> FacilityDocInput:
@@ -49,6 +50,40 @@ def test_extract_golden_example():
         assert len(citations) > 0
 
 
+def test_fallback_extract_dict_matches_json_output():
+    """Test the fallback client's parsed output matches its JSON string."""
+    doc = load_example("facility_input_golden.json")
+    client = FallbackClient()
+    
+    assert client.extract_dict(doc.source_text) == json.loads(client.extract(doc.source_text))
+
+
+def test_fallback_keyword_offsets_survive_lowercase_expansion():
+    """Test keyword citations point into the original text when lower() grows it."""
+    text = "İstanbul Clinic. We accept referrals and handle Emergency cases."
+    result = FallbackClient().extract_dict(text)
+    spans = {
+        citation["field"]: text[citation["start_char"]:citation["end_char"]]
+        for citation in result["citations"]
+    }
+    
+    assert spans["referral_capacity"] == "accept referrals"
+    assert spans["emergency_capability"] == "Emergency"
+
+
+def test_extract_batch_matches_single_calls():
+    """Test batch extraction returns per-document results in input order."""
+    docs = [
+        load_example("facility_input_golden.json"),
+        load_example("facility_input_2.json"),
+        load_example("facility_input_3.json"),
+    ]
+    
+    results = extract_capabilities_batch(docs, concurrency=3)
+    
+    assert results == [extract_capabilities(doc) for doc in docs]
+
+
 def test_extract_input_2():
     """Test extraction on input 2 (basic facility)."""
     doc = load_example("facility_input_2.json")
@@ -183,3 +218,49 @@ def test_citation_source_id_matches():
         # In LLM mode, it should match doc.source_id
         assert citation.source_id is not None
         assert len(citation.source_id) > 0
+
+
+def test_combined_keyword_scan_matches_per_keyword_search():
+    """Test the single-alternation keyword scan finds what per-keyword searches find.
+    
+    Guards against adding a keyword that overlaps another inside a word
+    boundary (e.g. "ct" next to "ct scan"), which the combined scan would
+    silently miss.
+    """
+    import re
+    
+    client = FallbackClient()
+    fields = [
+        ("services", client.SERVICES_KEYWORDS, client.SERVICES_PATTERNS),
+        ("equipment", client.EQUIPMENT_KEYWORDS, client.EQUIPMENT_PATTERNS),
+        ("staffing", client.STAFFING_KEYWORDS, client.STAFFING_PATTERNS),
+    ]
+    all_keywords = [kw for _, keywords, _ in fields for kw in keywords]
+    
+    texts = [
+        ", ".join(all_keywords),
+        " ".join(reversed(all_keywords)).upper(),
+        load_example("facility_input_golden.json").source_text,
+        load_example("facility_input_3.json").source_text,
+        # Non-ASCII text takes the str pattern path
+        "Hôpital İlçe: CT Scanner and CT scan, X-RAY; Midwives & Nurse, "
+        "Laboratory Technician, Wound Care — outpatient/inpatient.",
+    ]
+    
+    for text in texts:
+        text_ascii = text.encode("ascii") if text.isascii() else None
+        for field_name, keywords, patterns in fields:
+            items, citations = client._extract_list_field(
+                text, text_ascii, keywords, patterns, field_name
+            )
+            
+            expected = []
+            for keyword in keywords:
+                match = re.search(rf"\b{re.escape(keyword)}\b", text, re.IGNORECASE)
+                if match and keyword.title() not in [item for item, _ in expected]:
+                    expected.append((keyword.title(), match.span()))
+            
+            assert [
+                (item, (c["start_char"], c["end_char"]))
+                for item, c in zip(items, citations)
+            ] == expected
@@ -70,3 +70,131 @@ def test_mlflow_integration_in_qa():
     assert "answer" in result
     assert "citations" in result
     assert "trace_id" in result
+
+
+@pytest.fixture
+def fake_mlflow(monkeypatch):
+    """Enable mlflow_utils against a mocked MLflow client."""
+    from collections import namedtuple
+    from unittest.mock import MagicMock
+    import medlinker_ai.mlflow_utils as mlflow_utils
+    
+    fake = MagicMock()
+    fake.start_run.side_effect = lambda run_name=None: MagicMock(
+        info=MagicMock(run_id=f"run-{run_name}")
+    )
+    fake.active_run.return_value = None
+    client = MagicMock()
+    
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", "file:///tmp/mlruns")
+    monkeypatch.setattr(mlflow_utils, "MLFLOW_AVAILABLE", True)
+    monkeypatch.setattr(mlflow_utils, "mlflow", fake, raising=False)
+    monkeypatch.setattr(mlflow_utils, "MlflowClient", lambda: client, raising=False)
+    monkeypatch.setattr(
+        mlflow_utils, "Metric",
+        namedtuple("Metric", "key value timestamp step"), raising=False
+    )
+    monkeypatch.setattr(
+        mlflow_utils, "Param", namedtuple("Param", "key value"), raising=False
+    )
+    monkeypatch.setattr(
+        mlflow_utils, "RunTag", namedtuple("RunTag", "key value"), raising=False
+    )
+    yield fake, client
+    mlflow_utils._reset_run_state(None)
+
+
+def test_mlflow_run_data_flushed_to_started_run(fake_mlflow):
+    """Test buffered data goes to the run that was started, in one batch."""
+    fake, client = fake_mlflow
+    
+    start_mlflow_run("qa")
+    log_params({"provider": "none"})
+    log_metrics({"answer_length": 10})
+    log_metrics({"answer_length": 12})
+    set_tags({"intent": "desert"})
+    client.log_batch.assert_not_called()
+    
+    end_mlflow_run()
+    
+    client.log_batch.assert_called_once()
+    args, kwargs = client.log_batch.call_args
+    assert args == ("run-qa",)
+    assert [(p.key, p.value) for p in kwargs["params"]] == [("provider", "none")]
+    assert [(t.key, t.value) for t in kwargs["tags"]] == [("intent", "desert")]
+    
+    # Repeated metrics keep every value as a step series
+    assert [(m.key, m.value, m.step) for m in kwargs["metrics"]] == [
+        ("answer_length", 10.0, 0),
+        ("answer_length", 12.0, 1),
+    ]
+    
+    # The run is not active any more, so nothing else is ended
+    fake.end_run.assert_not_called()
+
+
+def test_mlflow_run_data_split_within_batch_limits(fake_mlflow):
+    """Test large buffers are sent in several log_batch calls within limits."""
+    import medlinker_ai.mlflow_utils as mlflow_utils
+    _, client = fake_mlflow
+    
+    start_mlflow_run("big")
+    for i in range(250):
+        log_params({f"param_{i}": i})
+    for i in range(2500):
+        log_metrics({"score": i})
+    end_mlflow_run()
+    
+    sent_params = []
+    sent_metrics = []
+    for args, kwargs in client.log_batch.call_args_list:
+        assert args == ("run-big",)
+        assert len(kwargs["params"]) <= mlflow_utils.MAX_BATCH_PARAMS
+        assert len(kwargs["metrics"]) <= mlflow_utils.MAX_BATCH_METRICS
+        assert (
+            len(kwargs["params"]) + len(kwargs["metrics"]) + len(kwargs["tags"])
+            <= mlflow_utils.MAX_BATCH_ENTITIES
+        )
+        sent_params.extend(kwargs["params"])
+        sent_metrics.extend(kwargs["metrics"])
+    
+    assert len(sent_params) == 250
+    assert [m.step for m in sent_metrics] == list(range(2500))
+
+
+def test_mlflow_run_buffers_are_per_thread(fake_mlflow):
+    """Test a run started in another thread does not clear this thread's buffer."""
+    import threading
+    _, client = fake_mlflow
+    
+    start_mlflow_run("main")
+    log_metrics({"answer_length": 5})
+    
+    def other_request():
+        start_mlflow_run("other")
+        log_metrics({"answer_length": 7})
+        end_mlflow_run()
+    
+    worker = threading.Thread(target=other_request)
+    worker.start()
+    worker.join()
+    end_mlflow_run()
+    
+    sent = {
+        args[0]: [(m.key, m.value) for m in kwargs["metrics"]]
+        for args, kwargs in client.log_batch.call_args_list
+    }
+    assert sent == {
+        "run-other": [("answer_length", 7.0)],
+        "run-main": [("answer_length", 5.0)],
+    }
+
+
+def test_mlflow_log_metrics_skips_empty_without_run(fake_mlflow):
+    """Test all-None metrics with no run started make no MLflow call."""
+    fake, client = fake_mlflow
+    
+    log_metrics({"x": None})
+    
+    fake.log_metrics.assert_not_called()
+    client.log_batch.assert_not_called()
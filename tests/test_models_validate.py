@@ -3,12 +3,14 @@
 import json
 from pathlib import Path
 import pytest
+from pydantic import ValidationError
 
 from medlinker_ai.models import (
     FacilityDocInput,
     CapabilitySchemaV0,
     Citation,
     FacilityAnalysisOutput,
+    construct_facility_output,
 )
 
 
@@ -182,3 +184,48 @@ def test_default_values():
     
     assert output.reasons == []
     assert output.citations == []
+
+
+def test_location_strings_interned():
+    """Test that repeated region/country values share one string object."""
+    outputs = [
+        FacilityAnalysisOutput(
+            facility_id=f"TEST-{i:03d}",
+            region="".join(["Greater ", "Accra"]),  # Fresh string each time
+            country="".join(["Gh", "ana"]),
+            extracted_capabilities=CapabilitySchemaV0(),
+            status="VERIFIED",
+            confidence="HIGH",
+            trace_id="test_trace"
+        )
+        for i in range(2)
+    ]
+    
+    assert outputs[0].region is outputs[1].region
+    assert outputs[0].country is outputs[1].country
+
+
+def test_construct_facility_output_matches_validation():
+    """Test trusted construction yields the same model as validation."""
+    data = load_json("facility_output_expected_golden.json")
+    validated = FacilityAnalysisOutput(**data)
+    
+    constructed = construct_facility_output(validated.model_dump())
+    
+    assert constructed == validated
+    assert isinstance(constructed.extracted_capabilities, CapabilitySchemaV0)
+    assert all(isinstance(c, Citation) for c in constructed.citations)
+
+
+def test_models_are_frozen():
+    """Test that data contract models reject mutation."""
+    output = FacilityAnalysisOutput(
+        facility_id="TEST-001",
+        extracted_capabilities=CapabilitySchemaV0(),
+        status="VERIFIED",
+        confidence="HIGH",
+        trace_id="test_trace"
+    )
+    
+    with pytest.raises(ValidationError):
+        output.status = "SUSPICIOUS"
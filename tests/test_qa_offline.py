@@ -14,6 +14,7 @@ from medlinker_ai.models import (
 from medlinker_ai.qa import (
     keyword_match_score,
     retrieve_context,
+    build_search_texts,
     detect_question_intent,
     answer_planner_question
 )
@@ -101,6 +102,29 @@ def test_retrieve_context():
     assert len(context["selected_regions"]) <= 2
 
 
+def test_retrieve_context_sees_in_place_edits():
+    """Test retrieval reflects list edits and matches prebuilt search texts."""
+    facilities = [
+        create_test_facility("F1", ["X-ray"], [], []),
+        create_test_facility("F2", ["Emergency"], [], []),
+    ]
+    regions = [create_test_region("GH", "ACC", 20, [])]
+    
+    first = retrieve_context("ultrasound", facilities, regions, k=1)
+    assert first["selected_facilities"][0].facility_id == "F1"
+    
+    # Same list object and length, different contents
+    facilities[1] = create_test_facility("F3", ["Ultrasound"], [], [])
+    edited = retrieve_context("ultrasound", facilities, regions, k=1)
+    assert edited["selected_facilities"][0].facility_id == "F3"
+    
+    prebuilt = retrieve_context(
+        "ultrasound", facilities, regions, k=1,
+        search_texts=build_search_texts(facilities, regions)
+    )
+    assert prebuilt == edited
+
+
 def test_detect_question_intent():
     """Test question intent detection."""
     assert detect_question_intent("Which regions lack C-section?") == "desert"
@@ -100,6 +100,129 @@ def test_trace_basic_lifecycle(cleanup_traces):
     assert trace.spans[0].evidence_refs == 2
 
 
+@pytest.fixture
+def fake_mlflow(monkeypatch):
+    """Enable MLflow tracing against a mocked MLflow client."""
+    from collections import namedtuple
+    from unittest.mock import MagicMock
+    import medlinker_ai.trace as trace_module
+    
+    fake = MagicMock()
+    fake.active_run.return_value = MagicMock(info=MagicMock(run_id="run-1"))
+    client = MagicMock()
+    
+    monkeypatch.setattr(trace_module, "mlflow", fake, raising=False)
+    monkeypatch.setattr(trace_module, "MlflowClient", lambda: client, raising=False)
+    monkeypatch.setattr(
+        trace_module, "Metric",
+        namedtuple("Metric", "key value timestamp step"), raising=False
+    )
+    monkeypatch.setattr(
+        trace_module, "Param", namedtuple("Param", "key value"), raising=False
+    )
+    monkeypatch.setattr(
+        trace_module, "RunTag", namedtuple("RunTag", "key value"), raising=False
+    )
+    monkeypatch.setattr(trace_module, "_mlflow_available", True)
+    return client
+
+
+def _logged(client, field):
+    """Collect (key, value) pairs sent to log_batch for one entity type."""
+    return [
+        (entity.key, entity.value)
+        for _, kwargs in client.log_batch.call_args_list
+        for entity in kwargs.get(field, [])
+    ]
+
+
+def test_trace_mlflow_writes_batched_at_end(fake_mlflow, cleanup_traces):
+    """Test MLflow tags/params/metrics are buffered and written once per trace."""
+    client = fake_mlflow
+    
+    trace_id = str(uuid.uuid4())
+    start_trace(trace_id)
+    for step_name in ("extract", "verify"):
+        log_span(
+            trace_id=trace_id,
+            step_name=step_name,
+            inputs_summary={"facility_id": "FAC001"},
+            outputs_summary={"count": 3},
+            evidence_refs=2
+        )
+    
+    # Nothing sent to MLflow until the trace ends
+    client.log_batch.assert_not_called()
+    
+    end_trace(trace_id)
+    
+    assert all(args == ("run-1",) for args, _ in client.log_batch.call_args_list)
+    assert _logged(client, "tags") == [
+        ("step_extract", "completed"), ("step_verify", "completed")
+    ]
+    assert _logged(client, "params") == [
+        ("extract_input_facility_id", "FAC001"), ("verify_input_facility_id", "FAC001")
+    ]
+    assert _logged(client, "metrics") == [
+        ("extract_count", 3.0),
+        ("extract_evidence_refs", 2.0),
+        ("verify_count", 3.0),
+        ("verify_evidence_refs", 2.0),
+    ]
+
+
+def test_trace_mlflow_keeps_repeated_step_metrics(fake_mlflow, cleanup_traces):
+    """Test spans sharing a step name log every value as a metric series."""
+    client = fake_mlflow
+    
+    trace_id = str(uuid.uuid4())
+    start_trace(trace_id)
+    for region, score in (("North", 40), ("South", 75)):
+        log_span(
+            trace_id=trace_id,
+            step_name="aggregate",
+            inputs_summary={"region": region},
+            outputs_summary={"desert_score": score},
+            evidence_refs=1
+        )
+    end_trace(trace_id)
+    
+    metrics = [
+        (m.key, m.value, m.step)
+        for _, kwargs in client.log_batch.call_args_list
+        for m in kwargs.get("metrics", [])
+        if m.key == "aggregate_desert_score"
+    ]
+    assert metrics == [
+        ("aggregate_desert_score", 40.0, 0),
+        ("aggregate_desert_score", 75.0, 1),
+    ]
+
+
+def test_trace_mlflow_param_failure_keeps_metrics(fake_mlflow, cleanup_traces):
+    """Test a failed params write does not drop the trace's metrics."""
+    client = fake_mlflow
+    
+    def fail_on_params(run_id, **kwargs):
+        if kwargs.get("params"):
+            raise ValueError("param value too long")
+    
+    client.log_batch.side_effect = fail_on_params
+    
+    trace_id = str(uuid.uuid4())
+    start_trace(trace_id)
+    log_span(
+        trace_id=trace_id,
+        step_name="extract",
+        inputs_summary={"facility_id": "FAC001"},
+        outputs_summary={"count": 3},
+        evidence_refs=2
+    )
+    end_trace(trace_id)
+    
+    assert ("extract_count", 3.0) in _logged(client, "metrics")
+
+
 def test_trace_multiple_spans(cleanup_traces):
     """Test trace with multiple spans."""
     trace_id = str(uuid.uuid4())
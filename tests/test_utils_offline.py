@@ -0,0 +1,73 @@
+"""Tests for data file utilities (offline mode)."""
+
+import os
+
+import pytest
+
+from medlinker_ai.utils import open_data_file, resolve_data_file
+
+
+LINES = [b'{"facility_id": "F1"}\n', b'{"facility_id": "F2"}\n']
+
+
+@pytest.mark.parametrize("suffix", ["", ".gz"])
+def test_open_data_file_round_trip(tmp_path, suffix):
+    """Test plain and gzip data files read back what was written."""
+    path = tmp_path / f"facilities.jsonl{suffix}"
+    
+    with open_data_file(path, "wb") as f:
+        f.writelines(LINES)
+    with open_data_file(path) as f:
+        assert list(f) == LINES
+
+
+def test_open_data_file_gzip_is_compressed(tmp_path):
+    """Test .gz files are actually gzip-compressed on disk."""
+    import gzip
+    
+    path = tmp_path / "facilities.jsonl.gz"
+    with open_data_file(path, "wb") as f:
+        f.writelines(LINES)
+    
+    assert gzip.decompress(path.read_bytes()) == b"".join(LINES)
+
+
+def test_open_data_file_zstd_round_trip(tmp_path):
+    """Test .zst data files read back what was written (needs zstandard)."""
+    zstandard = pytest.importorskip("zstandard")
+    
+    path = tmp_path / "facilities.jsonl.zst"
+    with open_data_file(path, "wb") as f:
+        f.writelines(LINES)
+    
+    with open_data_file(path) as f:
+        assert list(f) == LINES
+    
+    with open(path, "rb") as f:
+        assert zstandard.ZstdDecompressor().stream_reader(f).read() == b"".join(LINES)
+
+
+def test_open_data_file_rejects_text_mode(tmp_path):
+    """Test only binary read/write modes are accepted."""
+    with pytest.raises(ValueError):
+        open_data_file(tmp_path / "facilities.jsonl", "r")
+
+
+def test_resolve_data_file_picks_newest_variant(tmp_path):
+    """Test the most recently modified variant wins."""
+    path = tmp_path / "facilities.jsonl"
+    variants = [path, tmp_path / "facilities.jsonl.gz", tmp_path / "facilities.jsonl.zst"]
+    for variant in variants:
+        variant.write_bytes(b"")
+    
+    for newest in variants:
+        for age, variant in enumerate(v for v in variants if v != newest):
+            os.utime(variant, ns=(0, (age + 1) * 1_000_000_000))
+        os.utime(newest, ns=(0, 10_000_000_000))
+        
+        assert resolve_data_file(path) == newest
+
+
+def test_resolve_data_file_missing(tmp_path):
+    """Test None is returned when no variant exists."""
+    assert resolve_data_file(tmp_path / "facilities.jsonl") is None
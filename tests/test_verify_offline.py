@@ -187,3 +187,35 @@ def test_suspicious_surgery_without_anesthesia():
     if has_surgery and not has_anesthesia:
         assert analysis.status == "SUSPICIOUS"
         assert any("anesthe" in r.lower() or "surgical" in r.lower() for r in analysis.reasons)
+
+
+def test_verify_facilities_parallel_matches_serial(monkeypatch, tmp_path):
+    """Test process-parallel verification matches the serial path and traces."""
+    import orjson
+    import medlinker_ai.cli as cli_module
+    
+    monkeypatch.chdir(tmp_path)
+    docs = [
+        load_example(name).model_copy(update={"facility_id": f"FAC{i:03d}"})
+        for i, name in enumerate(
+            ["facility_input_golden.json", "facility_input_2.json", "facility_input_3.json"] * 3
+        )
+    ]
+    
+    serial = list(cli_module._verify_facilities(docs))
+    monkeypatch.setattr(cli_module, "PARALLEL_VERIFY_MIN_FACILITIES", 1)
+    parallel = list(cli_module._verify_facilities(docs))
+    
+    def strip_trace(results):
+        return [
+            (analysis.model_dump(exclude={"trace_id"}), error)
+            for analysis, error in results
+        ]
+    
+    assert strip_trace(parallel) == strip_trace(serial)
+    
+    # Worker traces are written by the parent, one whole line per facility
+    lines = (tmp_path / "outputs" / "traces.jsonl").read_bytes().splitlines()
+    trace_ids = [orjson.loads(line)["trace_id"] for line in lines]
+    assert len(trace_ids) == 2 * len(docs)
+    assert trace_ids[len(docs):] == [analysis.trace_id for analysis, _ in parallel]